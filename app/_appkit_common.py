@@ -0,0 +1,34 @@
+"""
+Shared AppKit/Foundation imports for the Touch Bar modules
+Importing through this module binds the AppKit symbols once per process;
+ImportError propagates so callers keep their own availability checks
+"""
+
+from Foundation import NSObject, NSRunLoop, NSDefaultRunLoopMode
+from AppKit import (
+    NSApplication,
+    NSApp,
+    NSStatusBar,
+    NSMenu,
+    NSMenuItem,
+    NSAlert,
+    NSInformationalAlertStyle,
+    NSWindow,
+    NSView,
+    NSButton,
+    NSTextField,
+    NSScrollView,
+    NSTextView,
+    NSMakeRect,
+    NSRect,
+    NSSize,
+    NSPoint,
+    NSWindowStyleMaskTitled,
+    NSWindowStyleMaskClosable,
+    NSWindowStyleMaskMiniaturizable,
+    NSWindowStyleMaskResizable,
+    NSBackingStoreBuffered,
+    NSWindowLevelFloating,
+    NSApplicationActivationPolicyAccessory,
+    NSApplicationActivationPolicyRegular,
+)
@@ -0,0 +1,263 @@
+"""
+Shared Touch Bar search window
+Used by touchbar_working and touchbar_working_final
+"""
+
+import asyncio
+import threading
+import logging
+import time
+from collections import OrderedDict
+
+import objc
+from openai import AuthenticationError
+from Foundation import NSObject, NSTimer
+from libdispatch import dispatch_async, dispatch_get_main_queue
+from AppKit import (
+    NSWindow,
+    NSButton,
+    NSTextField,
+    NSScrollView,
+    NSTextView,
+    NSMakeRect,
+    NSWindowStyleMaskTitled,
+    NSWindowStyleMaskClosable,
+    NSWindowStyleMaskMiniaturizable,
+    NSWindowStyleMaskResizable,
+    NSBackingStoreBuffered,
+    NSWindowLevelFloating,
+)
+
+from app.azure_service import AzureOpenAIService
+
+logger = logging.getLogger(__name__)
+
+# Delay before a search is sent, so repeated Enter presses send only one query
+SEARCH_DEBOUNCE_SECONDS = 0.12
+
+# Number of answers kept for repeated questions
+ANSWER_CACHE_SIZE = 64
+
+# Streamed pieces arriving within this window are shown in one text update
+STREAM_FLUSH_SECONDS = 0.03
+
+# Window and widget frames are fixed, so build the rects once at import
+_WINDOW_RECT = NSMakeRect(100, 100, 600, 400)
+_SEARCH_FIELD_RECT = NSMakeRect(20, 350, 400, 30)
+_SEARCH_BTN_RECT = NSMakeRect(440, 350, 80, 30)
+_SCROLL_RECT = NSMakeRect(20, 20, 560, 320)
+_TEXT_RECT = NSMakeRect(0, 0, 560, 320)
+
+
+class TouchBarSearchWindow(NSObject):
+    """Search window that appears when Touch Bar button is pressed"""
+
+    def init(self):
+        self = objc.super(TouchBarSearchWindow, self).init()
+        if self is None:
+            return None
+
+        # Create the search window
+        self.window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
+            _WINDOW_RECT,
+            NSWindowStyleMaskTitled
+            | NSWindowStyleMaskClosable
+            | NSWindowStyleMaskMiniaturizable
+            | NSWindowStyleMaskResizable,
+            NSBackingStoreBuffered,
+            False,
+        )
+
+        self.window.setTitle_("Touch Bar Coding Assistant")
+        self.window.setLevel_(NSWindowLevelFloating)
+        self.window.makeKeyAndOrderFront_(None)
+
+        # Long-lived event loop for searches, run on one background thread
+        self._loop = asyncio.new_event_loop()
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+        # Debounce state: only the latest query within the window is sent
+        self._pending_timer = None
+        self._inflight_future = None
+
+        # Bumped per search so streamed text from a superseded query is dropped
+        self._search_generation = 0
+
+        # LRU of answers keyed by normalized question, plus per-question
+        # [lock, users] entries so duplicate submissions share one Azure call.
+        # Both are only touched from the background loop.
+        self._answer_cache = OrderedDict()
+        self._search_locks = {}
+
+        # Create the search interface
+        self._create_search_interface()
+
+        return self
+
+    def _create_search_interface(self):
+        """Create the search interface elements"""
+        add = self.window.contentView().addSubview_
+
+        # Search field
+        self.search_field = NSTextField.alloc().initWithFrame_(_SEARCH_FIELD_RECT)
+        self.search_field.setPlaceholderString_("Enter your coding question...")
+        add(self.search_field)
+
+        # Search button
+        self.search_button = NSButton.buttonWithTitle_target_action_(
+            "Search", self, self.search_action_
+        )
+        self.search_button.setFrame_(_SEARCH_BTN_RECT)
+        add(self.search_button)
+
+        # Answer text view
+        scroll_view = NSScrollView.alloc().initWithFrame_(_SCROLL_RECT)
+        self.answer_text = NSTextView.alloc().initWithFrame_(_TEXT_RECT)
+        self.answer_text.setEditable_(False)
+        self.answer_text.setString_("Ask a coding interview question...")
+        scroll_view.setDocumentView_(self.answer_text)
+        add(scroll_view)
+
+        # Bind Enter key to search
+        self.search_field.setTarget_(self)
+        self.search_field.setAction_(self.search_action_)
+
+    @objc.typedSelector(b"v@:@")
+    def search_action_(self, sender):
+        """Handle search button click or Enter key"""
+        question = self.search_field.stringValue().strip()
+        if not question:
+            return
+
+        # Update UI
+        self.search_button.setEnabled_(False)
+        self.answer_text.setString_("Searching...")
+
+        # Restart the debounce window so rapid submissions collapse into one
+        if self._pending_timer is not None:
+            self._pending_timer.invalidate()
+        self._pending_timer = (
+            NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+                SEARCH_DEBOUNCE_SECONDS, self, "searchTimerFired:", question, False
+            )
+        )
+
+    def searchTimerFired_(self, timer):
+        """Run the search once the debounce window has passed"""
+        self._pending_timer = None
+        self._run_search(timer.userInfo())
+
+    def _run_search(self, question: str):
+        """Schedule the search on the background event loop"""
+        # A newer query supersedes whatever is still in flight
+        if self._inflight_future is not None and not self._inflight_future.done():
+            self._inflight_future.cancel()
+
+        self._search_generation += 1
+        future = asyncio.run_coroutine_threadsafe(
+            self._perform_search(question, self._search_generation), self._loop
+        )
+        future.add_done_callback(self._search_finished)
+        self._inflight_future = future
+
+    def _search_finished(self, future):
+        """Post the search result back to the main thread"""
+        # Superseded searches leave the UI to the query that replaced them
+        if future.cancelled():
+            return
+
+        try:
+            answer = future.result()
+        except Exception as e:
+            logger.error(f"Search error: {str(e)}")
+            answer = f"Error: {str(e)}"
+
+        # Update UI in main thread
+        dispatch_async(dispatch_get_main_queue(), lambda: self._update_answer_(answer))
+
+    def shutdown(self):
+        """Stop the background event loop"""
+        self._loop.call_soon_threadsafe(self._loop.stop)
+
+    def _update_answer_(self, answer: str):
+        """Update the answer display"""
+        self.answer_text.setString_(answer)
+        self.search_button.setEnabled_(True)
+
+    def _show_partial(self, text: str, generation: int, replace: bool):
+        """Append (or start) streamed answer text; runs on the main thread"""
+        if generation != self._search_generation:
+            return
+
+        storage = self.answer_text.textStorage()
+        storage.beginEditing()
+        if replace:
+            storage.mutableString().setString_(text)
+        else:
+            storage.mutableString().appendString_(text)
+        storage.endEditing()
+
+    async def _stream_answer(self, question: str, generation: int) -> str:
+        """Stream the answer into the text view and return the full text"""
+        main_queue = dispatch_get_main_queue()
+        pieces = []
+        pending = []
+        shown = False
+        last_flush = 0.0
+
+        async for piece in AzureOpenAIService.stream_coding_answer(question):
+            pieces.append(piece)
+            pending.append(piece)
+
+            now = time.monotonic()
+            if now - last_flush >= STREAM_FLUSH_SECONDS:
+                text, replace = "".join(pending), not shown
+                dispatch_async(
+                    main_queue,
+                    lambda t=text, r=replace: self._show_partial(t, generation, r),
+                )
+                pending.clear()
+                shown = True
+                last_flush = now
+
+        # The final _update_answer_ sets the complete text, so any unflushed
+        # tail doesn't need its own update
+        return "".join(pieces)
+
+    async def _perform_search(self, question: str, generation: int) -> str:
+        """Perform the actual search using Azure OpenAI"""
+        key = " ".join(question.strip().lower().split())
+        # The entry stays until its last user leaves, so a caller queued on the
+        # lock is never handed a fresh one by a caller arriving after it
+        entry = self._search_locks.setdefault(key, [asyncio.Lock(), 0])
+        entry[1] += 1
+
+        try:
+            async with entry[0]:
+                if key in self._answer_cache:
+                    self._answer_cache.move_to_end(key)
+                    return self._answer_cache[key]
+
+                answer = await self._stream_answer(question, generation)
+                if not answer:
+                    return "Unable to generate answer. Please try again."
+
+                self._answer_cache[key] = answer
+                if len(self._answer_cache) > ANSWER_CACHE_SIZE:
+                    self._answer_cache.popitem(last=False)
+                return answer
+        except AuthenticationError as e:
+            # Startup no longer probes the connection, so surface bad
+            # credentials here where the user can see them
+            logger.error(f"Azure OpenAI authentication failed: {str(e)}")
+            return (
+                "Error: Azure OpenAI rejected the credentials - check "
+                "AZURE_OPENAI_API_KEY and AZURE_OPENAI_ENDPOINT in your .env file"
+            )
+        except Exception as e:
+            logger.error(f"Azure OpenAI error: {str(e)}")
+            return f"Error: Unable to get answer - {str(e)}"
+        finally:
+            entry[1] -= 1
+            if not entry[1]:
+                del self._search_locks[key]
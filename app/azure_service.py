@@ -1,7 +1,11 @@
+import asyncio
 import logging
 import os
 import re
-from openai import AzureOpenAI
+from typing import AsyncIterator
+
+import httpx
+from openai import AzureOpenAI, AsyncAzureOpenAI
 from azure.core.credentials import AzureKeyCredential
 from app.config import settings
 
@@ -45,10 +49,125 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Extracts the base Azure endpoint from a full resource or deployment URL
+_ENDPOINT_RE = re.compile(r"(https://[^/]+\.(?:openai|cognitive)\.azure\.com)(?:/.*)?")
+
+# Splits a numbered-list reply ("1. ...\n2. ...") into its items
+_NUMBERED_RE = re.compile(r"^\s*\d+\.\s*", re.M)
+
 
 class AzureOpenAIService:
     """Service for handling Azure OpenAI operations"""
 
+    # Shared async client with a bounded connection pool, set up by warmup().
+    # Its kept-alive connections belong to the event loop that first uses it.
+    _async_client = None
+    _client_loop = None
+
+    @staticmethod
+    def _base_endpoint(endpoint: str) -> str:
+        """
+        Reduce a full resource or deployment URL to the base Azure endpoint
+
+        Args:
+            endpoint (str): The configured Azure endpoint URL
+
+        Returns:
+            str: The base endpoint without path or trailing slash
+        """
+        # Match and extract the base Azure endpoint
+        match = _ENDPOINT_RE.match(endpoint)
+
+        if match:
+            endpoint = match.group(1)
+            logger.info(f"Extracted base Azure endpoint: {endpoint}")
+        else:
+            logger.warning(f"Unable to parse Azure endpoint from: {endpoint}")
+            # Default fallback if unable to parse
+            if "/deployments/" in endpoint:
+                endpoint = endpoint.split("/deployments/")[0]
+                logger.info(f"Using fallback method to extract endpoint: {endpoint}")
+            elif endpoint.endswith("/"):
+                endpoint = endpoint.rstrip("/")
+                logger.info(f"Removing trailing slash from endpoint: {endpoint}")
+        return endpoint
+
+    @classmethod
+    def warmup(cls, http_client=None):
+        """
+        Create the shared async Azure OpenAI client if it does not exist yet
+
+        Reusing one client keeps TCP/TLS connections alive between questions
+        instead of reconnecting for every completion. Only callers running a
+        single long-lived event loop should warm it up; code that creates a
+        loop per request keeps using get_llm().
+
+        Args:
+            http_client (httpx.AsyncClient): Optional caller-owned HTTP client
+                                             to use instead of the default pool
+
+        Returns:
+            AsyncAzureOpenAI: The shared async client
+        """
+        if cls._async_client is None:
+            if http_client is None:
+                http_client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=8, max_keepalive_connections=8
+                    ),
+                    timeout=30,
+                )
+            cls._async_client = AsyncAzureOpenAI(
+                api_version=settings.AZURE_OPENAI_API_VERSION,
+                azure_endpoint=cls._base_endpoint(settings.AZURE_OPENAI_ENDPOINT),
+                api_key=settings.AZURE_OPENAI_API_KEY,
+                http_client=http_client,
+            )
+            logger.info("Azure OpenAI async client warmed up")
+        return cls._async_client
+
+    @classmethod
+    async def aclose(cls):
+        """Close the shared async client and its connection pool, if any"""
+        if cls._async_client is not None:
+            client, cls._async_client = cls._async_client, None
+            cls._client_loop = None
+            await client.close()
+
+    @classmethod
+    def _shared_client(cls):
+        """
+        Return the shared async client if it may be used on the running loop
+
+        The client is bound to the first loop that uses it; on any other loop
+        its pooled connections would be tied to a loop that may be closed.
+
+        Returns:
+            AsyncAzureOpenAI: The shared client, or None if it is not usable here
+        """
+        if cls._async_client is None:
+            return None
+        loop = asyncio.get_running_loop()
+        if cls._client_loop is None:
+            cls._client_loop = loop
+        return cls._async_client if cls._client_loop is loop else None
+
+    @classmethod
+    def _loop_client(cls):
+        """
+        Warm up the shared async client and return it for the running loop
+
+        Raises:
+            RuntimeError: If the shared client is already bound to another loop.
+        """
+        cls.warmup()
+        client = cls._shared_client()
+        if client is None:
+            raise RuntimeError(
+                "Shared Azure OpenAI client is bound to another event loop"
+            )
+        return client
+
     @classmethod
     def get_llm(cls, fallback_to_openai=False):
         """
@@ -93,28 +212,7 @@ class AzureOpenAIService:
                 del os.environ["OPENAI_API_KEY"]
 
             # Clean up endpoint URL if needed - properly extract base URL
-            endpoint = settings.AZURE_OPENAI_ENDPOINT
-
-            # Pattern to match and extract the base Azure endpoint
-            base_endpoint_pattern = (
-                r"(https://[^/]+\.(?:openai|cognitive)\.azure\.com)(?:/.*)?"
-            )
-            match = re.match(base_endpoint_pattern, endpoint)
-
-            if match:
-                endpoint = match.group(1)
-                logger.info(f"Extracted base Azure endpoint: {endpoint}")
-            else:
-                logger.warning(f"Unable to parse Azure endpoint from: {endpoint}")
-                # Default fallback if unable to parse
-                if "/deployments/" in endpoint:
-                    endpoint = endpoint.split("/deployments/")[0]
-                    logger.info(
-                        f"Using fallback method to extract endpoint: {endpoint}"
-                    )
-                elif endpoint.endswith("/"):
-                    endpoint = endpoint.rstrip("/")
-                    logger.info(f"Removing trailing slash from endpoint: {endpoint}")
+            endpoint = cls._base_endpoint(settings.AZURE_OPENAI_ENDPOINT)
 
             # Create the Azure OpenAI client with retries
             try:
@@ -235,6 +333,18 @@ class AzureOpenAIService:
             # Set request timeout (in seconds)
             request_timeout = 60.0
 
+            # Reuse the pooled async client when it was warmed up for this loop
+            shared_client = cls._shared_client()
+            if shared_client is not None:
+                response = await shared_client.chat.completions.create(
+                    messages=messages,
+                    max_tokens=max_tokens,
+                    temperature=temperature,
+                    top_p=top_p,
+                    model=settings.AZURE_OPENAI_DEPLOYMENT_NAME,
+                )
+                return response.choices[0].message.content
+
             client = cls.get_llm(fallback_to_openai=False)
             if not client:
                 logger.error("Failed to get Azure OpenAI client")
@@ -281,16 +391,16 @@ class AzureOpenAIService:
             logger.error(f"Error generating completion: {str(e)}")
             return None
 
-    @classmethod
-    async def get_coding_answer(cls, question: str) -> str:
+    @staticmethod
+    def _coding_messages(question: str) -> list:
         """
-        Get a coding interview answer for a specific question
+        Build the chat messages for a coding interview question
 
         Args:
             question (str): The coding interview question
 
         Returns:
-            str: The answer optimized for Touch Bar display
+            list: System and user message dictionaries
         """
         system_prompt = """You are an expert coding interview assistant. Provide concise, 
         practical answers to coding interview questions. Focus on:
@@ -302,7 +412,7 @@ class AzureOpenAIService:
         Keep answers brief and suitable for display on a small screen (max 200 characters).
         If the answer is longer, provide the most essential information first."""
 
-        messages = [
+        return [
             {"role": "system", "content": system_prompt},
             {
                 "role": "user",
@@ -310,6 +420,19 @@ class AzureOpenAIService:
             },
         ]
 
+    @classmethod
+    async def get_coding_answer(cls, question: str) -> str:
+        """
+        Get a coding interview answer for a specific question
+
+        Args:
+            question (str): The coding interview question
+
+        Returns:
+            str: The answer optimized for Touch Bar display
+        """
+        messages = cls._coding_messages(question)
+
         try:
             response = await cls.generate_completion(
                 messages=messages,
@@ -328,3 +451,100 @@ class AzureOpenAIService:
         except Exception as e:
             logger.error(f"Error getting coding answer: {str(e)}")
             return "Error: Unable to connect to AI service."
+
+    @classmethod
+    async def get_coding_answers_batch(cls, questions: list) -> list:
+        """
+        Answer several coding interview questions with a single completion
+
+        The questions are sent as one numbered list and the numbered reply is
+        split back into answers. If the reply doesn't split into exactly one
+        answer per question, each question is asked separately instead.
+
+        Args:
+            questions (list): The coding interview questions
+
+        Returns:
+            list: One answer per question, in order
+        """
+        numbered = "\n".join(f"{i}. {q}" for i, q in enumerate(questions, 1))
+        messages = cls._coding_messages("")
+        messages[1]["content"] = (
+            "Answer each of the following coding interview questions in at most "
+            f"{settings.MAX_ANSWER_LENGTH} characters. Reply with a numbered list "
+            f"using the same numbers:\n{numbered}"
+        )
+
+        response = await cls.generate_completion(
+            messages=messages,
+            max_tokens=settings.MAX_TOKENS,
+            temperature=settings.TEMPERATURE,
+        )
+
+        answers = [a.strip() for a in _NUMBERED_RE.split(response or "")[1:]]
+        if len(answers) != len(questions):
+            logger.warning(
+                f"Batched reply had {len(answers)} answers for {len(questions)} "
+                "questions; asking them one at a time"
+            )
+            return list(
+                await asyncio.gather(*(cls.get_coding_answer(q) for q in questions))
+            )
+
+        # Truncate to fit Touch Bar
+        limit = settings.MAX_ANSWER_LENGTH
+        return [a if len(a) <= limit else a[: limit - 3] + "..." for a in answers]
+
+    @classmethod
+    async def stream_coding_answer(cls, question: str) -> AsyncIterator[str]:
+        """
+        Stream a coding interview answer as it is generated
+
+        Uses the shared async client (created on first use and bound to the
+        running loop) and stops once the answer reaches MAX_ANSWER_LENGTH,
+        ending with "..." like get_coding_answer.
+
+        Args:
+            question (str): The coding interview question
+
+        Yields:
+            str: Successive pieces of the answer text
+        """
+        client = cls._loop_client()
+        stream = await client.chat.completions.create(
+            messages=cls._coding_messages(question),
+            max_tokens=settings.MAX_TOKENS,
+            temperature=settings.TEMPERATURE,
+            model=settings.AZURE_OPENAI_DEPLOYMENT_NAME,
+            stream=True,
+        )
+
+        remaining = settings.MAX_ANSWER_LENGTH - 3
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            piece = chunk.choices[0].delta.content
+            if not piece:
+                continue
+            if len(piece) > remaining:
+                yield piece[:remaining] + "..."
+                return
+            remaining -= len(piece)
+            yield piece
+
+    @classmethod
+    async def embed(cls, text: str) -> list:
+        """
+        Get the embedding vector for a piece of text
+
+        Args:
+            text (str): Text to embed
+
+        Returns:
+            list: The embedding as a list of floats
+        """
+        client = cls._loop_client()
+        response = await client.embeddings.create(
+            model=settings.AZURE_OPENAI_EMBEDDING_DEPLOYMENT, input=text
+        )
+        return response.data[0].embedding
@@ -17,6 +17,9 @@ class Settings(BaseSettings):
     AZURE_OPENAI_API_VERSION: str = os.getenv(
         "AZURE_OPENAI_API_VERSION", "2024-02-15-preview"
     )
+    AZURE_OPENAI_EMBEDDING_DEPLOYMENT: str = os.getenv(
+        "AZURE_OPENAI_EMBEDDING_DEPLOYMENT", "text-embedding-3-small"
+    )
 
     # Touch Bar Configuration
     TOUCH_BAR_WIDTH: int = 1080  # Standard Touch Bar width
@@ -33,6 +36,7 @@ class Settings(BaseSettings):
     SEARCH_TIMEOUT: int = 30  # seconds
     MAX_TOKENS: int = 1000
     TEMPERATURE: float = 0.7
+    SEMANTIC_CACHE_THRESHOLD: float = 0.92  # cosine similarity for a cache hit
 
     class Config:
         env_file = ".env"
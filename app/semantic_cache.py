@@ -0,0 +1,115 @@
+"""
+Semantic answer cache
+Returns a stored answer when a new question's embedding is close enough to
+one that was already answered
+"""
+
+import logging
+
+# Make numpy import optional
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticCache:
+    """Fixed-size embedding cache with least-recently-used eviction"""
+
+    def __init__(self, dim: int = None, capacity: int = 256, threshold: float = 0.92):
+        """
+        Args:
+            dim (int): Embedding dimension; taken from the first stored
+                       embedding when not given, since it depends on the
+                       embedding deployment
+            capacity (int): Maximum number of cached answers
+            threshold (float): Minimum cosine similarity for a hit
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("numpy is required for the semantic cache")
+
+        self.threshold = threshold
+        self._capacity = capacity
+        # One contiguous float32 row per entry so lookup is a single mat-vec
+        self._vectors = None
+        if dim is not None:
+            self._vectors = np.zeros((capacity, dim), dtype=np.float32)
+        self._answers = [None] * capacity
+        self._last_used = np.zeros(capacity, dtype=np.int64)
+        self._size = 0
+        self._clock = 0
+
+    def __len__(self):
+        return self._size
+
+    def _fits(self, vec) -> bool:
+        """Check an embedding has the dimension of the cached ones"""
+        if vec.shape == (self._vectors.shape[1],):
+            return True
+        logger.warning(
+            f"Ignoring {vec.size}-d embedding in a "
+            f"{self._vectors.shape[1]}-d semantic cache"
+        )
+        return False
+
+    @staticmethod
+    def _normalize(embedding):
+        vec = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def get(self, embedding):
+        """
+        Look up the answer for the most similar cached question
+
+        Args:
+            embedding (list): Embedding of the new question
+
+        Returns:
+            str: Cached answer, or None when nothing is similar enough
+        """
+        if not self._size:
+            return None
+
+        query = self._normalize(embedding)
+        if not self._fits(query):
+            return None
+
+        sims = self._vectors[: self._size] @ query
+        idx = int(np.argmax(sims))
+        if sims[idx] < self.threshold:
+            return None
+
+        self._clock += 1
+        self._last_used[idx] = self._clock
+        logger.debug(f"Semantic cache hit (similarity {sims[idx]:.3f})")
+        return self._answers[idx]
+
+    def put(self, embedding, answer: str):
+        """
+        Store an answer, evicting the least recently used entry when full
+
+        Args:
+            embedding (list): Embedding of the answered question
+            answer (str): The answer to cache
+        """
+        vec = self._normalize(embedding)
+        if self._vectors is None:
+            self._vectors = np.zeros((self._capacity, vec.size), dtype=np.float32)
+        elif not self._fits(vec):
+            return
+
+        if self._size < len(self._answers):
+            idx = self._size
+            self._size += 1
+        else:
+            idx = int(np.argmin(self._last_used))
+
+        self._clock += 1
+        self._vectors[idx] = vec
+        self._answers[idx] = answer
+        self._last_used[idx] = self._clock
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Bundle-backed Touch Bar Integration for MacBook Pro
+Loads the native MTMRTouchBar.bundle (see touchbar_bundle/) so the Touch Bar
+delegate and button run natively; Python only receives the button press
+"""
+
+import asyncio
+import logging
+import threading
+from pathlib import Path
+
+# Import macOS APIs
+try:
+    import objc
+    from AppKit import NSApplication, NSApplicationActivationPolicyRegular
+
+    TOUCHBAR_AVAILABLE = True
+except ImportError as e:
+    print(f"macOS APIs not available: {e}")
+    TOUCHBAR_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_PATH = (
+    Path(__file__).parent.parent / "touchbar_bundle" / "build" / "MTMRTouchBar.bundle"
+)
+
+# Background event loop that services Touch Bar presses; only runs while the
+# bundle is active
+_loop = None
+_loop_thread = None
+
+
+async def handle_press():
+    """Handle a Touch Bar button press"""
+    logger.info("Touch Bar search button pressed")
+    print("🎯 Touch Bar button pressed!")
+
+
+def load_touch_bar():
+    """Load MTMRTouchBar.bundle and return an activated MTMRTouchBar instance"""
+    global _loop, _loop_thread
+
+    objc.registerMetaDataForSelector(
+        b"MTMRTouchBar",
+        b"setPressHandler:",
+        {
+            "arguments": {
+                2: {
+                    "callable": {
+                        "retval": {"type": b"v"},
+                        "arguments": {0: {"type": b"^v"}},
+                    }
+                }
+            }
+        },
+    )
+    bundle = objc.loadBundle("MTMRTouchBar", globals(), bundle_path=str(BUNDLE_PATH))
+    touch_bar = bundle.classNamed_("MTMRTouchBar").alloc().init()
+
+    loop = _loop = asyncio.new_event_loop()
+    _loop_thread = threading.Thread(target=loop.run_forever, daemon=True)
+    _loop_thread.start()
+
+    touch_bar.setPressHandler_(
+        lambda: asyncio.run_coroutine_threadsafe(handle_press(), loop)
+    )
+    touch_bar.activate()
+    return touch_bar
+
+
+def unload_touch_bar(touch_bar):
+    """Deactivate the MTMRTouchBar instance and stop the press event loop"""
+    global _loop, _loop_thread
+
+    touch_bar.deactivate()
+    if _loop is not None:
+        _loop.call_soon_threadsafe(_loop.stop)
+        _loop_thread.join()
+        _loop.close()
+        _loop = _loop_thread = None
+
+
+def main():
+    """Main function to run the bundle-backed Touch Bar integration"""
+    if not TOUCHBAR_AVAILABLE:
+        print("❌ Touch Bar APIs not available on this system")
+        return
+
+    if not BUNDLE_PATH.exists():
+        print(f"❌ {BUNDLE_PATH.name} not found - run touchbar_bundle/build.sh first")
+        return
+
+    touch_bar = None
+
+    try:
+        app = NSApplication.sharedApplication()
+        app.setActivationPolicy_(NSApplicationActivationPolicyRegular)
+
+        touch_bar = load_touch_bar()
+        print("🚀 Touch Bar Coding Assistant is running! Look for '🔍 Code'")
+        app.run()
+
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down Touch Bar Coding Assistant...")
+    finally:
+        if touch_bar:
+            unload_touch_bar(touch_bar)
+
+
+if __name__ == "__main__":
+    main()
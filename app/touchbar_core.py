@@ -0,0 +1,466 @@
+#!/usr/bin/env python3
+"""
+Shared Touch Bar Integration for MacBook Pro
+One configurable NSObject subclass backing the simple, simple-fixed and
+visible Touch Bar variants
+"""
+
+import argparse
+import logging
+import os
+import signal
+import sys
+
+# Import macOS APIs
+try:
+    import objc
+    from Foundation import NSObject, NSFileHandle, NSString
+    from libdispatch import dispatch_async, dispatch_get_main_queue
+    from AppKit import (
+        NSApplication,
+        NSApp,
+        NSAlert,
+        NSEvent,
+        NSEventTypeApplicationDefined,
+        NSWindow,
+        NSPanel,
+        NSButton,
+        NSTextField,
+        NSMakeRect,
+        NSWindowStyleMaskTitled,
+        NSWindowStyleMaskClosable,
+        NSBackingStoreBuffered,
+        NSApplicationActivationPolicyAccessory,
+        NSApplicationActivationPolicyRegular,
+        NSTouchBar,
+        NSTouchBarItem,
+    )
+
+    # Resolve NSColor once instead of on every Touch Bar item creation
+    _NSColor = objc.lookUpClass("NSColor")
+
+    # Constant window geometry, built once instead of per window creation
+    _LABEL_RECT = NSMakeRect(20, 50, 360, 100)
+    _TEST_BUTTON_RECT = NSMakeRect(20, 20, 100, 30)
+    _ALERT_PANEL_RECT = NSMakeRect(100, 100, 400, 120)
+
+    TOUCHBAR_AVAILABLE = True
+    print("✅ Touch Bar APIs loaded successfully!")
+
+except ImportError as e:
+    print(f"macOS APIs not available: {e}")
+    TOUCHBAR_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Private DFRFoundation framework, loaded on first use by the "use_dfr" variant
+_dfr_loaded = False
+_DFRDisplayServer = None
+_DFRTouchBarItem = None
+
+
+def _load_dfr_once():
+    """Load DFRFoundation and resolve its Touch Bar classes on first call"""
+    global _dfr_loaded, _DFRDisplayServer, _DFRTouchBarItem
+
+    if _dfr_loaded:
+        return
+
+    objc.loadBundle(
+        "DFRFoundation",
+        globals(),
+        "/System/Library/PrivateFrameworks/DFRFoundation.framework",
+    )
+    _DFRDisplayServer = objc.lookUpClass("DFRDisplayServer")
+    _DFRTouchBarItem = objc.lookUpClass("DFRTouchBarItem")
+    _dfr_loaded = True
+
+
+DEFAULT_CONFIG = {
+    "name": "Touch Bar",  # Shown in console output
+    "prefix": "touchbar",  # Identifier prefix for the Touch Bar item
+    "title": "Touch Bar Coding Assistant",  # Window title
+    "window_size": (400, 200),
+    "show_window": True,  # False uses the DFR display server without a window
+    "use_dfr": False,
+    "bezel_color": False,  # Blue bezel on the Touch Bar button
+    "accessory": False,  # Accessory activation policy instead of regular
+    "message": None,  # Label text shown in the window
+    "search_message": "Touch Bar button pressed! This will open the search window.",
+    "test_message": None,  # Adds a "Test Alert" button to the window when set
+    "verbose": False,  # Print setup/cleanup progress
+}
+
+
+class _DelegateProxy(NSObject):
+    """NSTouchBar delegate that forwards to an integration without retaining it"""
+
+    def initWithIntegration_(self, integration):
+        self = objc.super(_DelegateProxy, self).init()
+        if self is None:
+            return None
+
+        self._integration = objc.WeakRef(integration)
+        return self
+
+    def touchBar_makeItemForIdentifier_(self, touchBar, identifier):
+        integration = self._integration()
+        if integration is None:
+            return None
+        return integration.touchBar_makeItemForIdentifier_(touchBar, identifier)
+
+
+class TouchBarIntegration(NSObject):
+    """Configurable Touch Bar integration for MacBook Pro"""
+
+    # Immutable per-instance defaults, applied with one dict merge in init
+    _defaults = {
+        "is_active": False,
+        "touch_bar": None,
+        "touch_bar_item": None,
+        "window": None,
+        "_alert_panel": None,
+        "_delegate_proxy": None,
+        "_display_server": None,
+    }
+
+    def initWithConfig_(self, cfg):
+        self = objc.super(TouchBarIntegration, self).init()
+        if self is None:
+            return None
+
+        self.config = {**DEFAULT_CONFIG, **cfg}
+        self._bezel_color = self.config["bezel_color"]
+        self.__dict__.update(TouchBarIntegration._defaults)
+        self._items = {}
+
+        if not TOUCHBAR_AVAILABLE:
+            raise RuntimeError("Touch Bar APIs not available on this system")
+
+        self._window_rect = NSMakeRect(100, 100, *self.config["window_size"])
+
+        # Pre-bridged NSString shared by the identifier lists set on the Touch Bar
+        self.identifier = NSString.stringWithString_(
+            f"{self.config['prefix']}-search-button"
+        )
+
+        self._search_selector = objc.selector(self.search_action, signature=b"v@:@")
+        self._test_selector = objc.selector(self.test_action, signature=b"v@:@")
+
+        # Alert contents are static, so build them once
+        self._search_alert = self._make_alert(
+            "Touch Bar Coding Assistant", self.config["search_message"]
+        )
+        self._test_alert = self._make_alert(
+            "Touch Bar Test", self.config["test_message"] or ""
+        )
+
+        return self
+
+    def setup_touch_bar(self):
+        """Setup the Touch Bar with a search button"""
+        name = self.config["name"]
+        progress = [f"🔧 Setting up {name} Touch Bar..."]
+
+        try:
+            if self.config["use_dfr"]:
+                _load_dfr_once()
+
+            if self.config["show_window"]:
+                self._create_window()
+                progress.append("✅ Window created successfully!")
+
+            if self.config["use_dfr"]:
+                self._setup_dfr_touch_bar()
+            else:
+                self._setup_ns_touch_bar()
+                progress.append("✅ Touch Bar set for application!")
+
+            self.is_active = True
+            logger.info(f"✅ {name} Touch Bar integration activated!")
+            progress.append(
+                f"🎯 {name} Touch Bar button added! Look for '🔍 Code' on your Touch Bar"
+            )
+            self._report(progress)
+
+        except Exception:
+            logger.exception("Failed to setup Touch Bar")
+            raise
+
+    def _report(self, lines):
+        """Write progress lines in one go when running verbose"""
+        if self.config["verbose"]:
+            sys.stdout.write("\n".join(lines) + "\n")
+            sys.stdout.flush()
+
+    def _create_window(self):
+        """Create a visible window to make the app active"""
+        self.window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
+            self._window_rect,
+            NSWindowStyleMaskTitled | NSWindowStyleMaskClosable,
+            NSBackingStoreBuffered,
+            False,
+        )
+
+        self.window.setTitle_(self.config["title"])
+        content_view = self.window.contentView()
+
+        # Add a label to the window
+        if self.config["message"]:
+            label = NSTextField.alloc().initWithFrame_(_LABEL_RECT)
+            label.setStringValue_(self.config["message"])
+            label.setEditable_(False)
+            label.setBezeled_(False)
+            label.setDrawsBackground_(False)
+            label.setSelectable_(False)
+            content_view.addSubview_(label)
+
+        # Add a test button to the window
+        if self.config["test_message"]:
+            test_button = NSButton.alloc().initWithFrame_(_TEST_BUTTON_RECT)
+            test_button.setTitle_("Test Alert")
+            test_button.setTarget_(self)
+            test_button.setAction_(self._test_selector)
+            content_view.addSubview_(test_button)
+
+        self.window.makeKeyAndOrderFront_(None)
+
+    def _setup_ns_touch_bar(self):
+        """Setup the Touch Bar using NSTouchBar"""
+        self.touch_bar = NSTouchBar.alloc().init()
+        # NSTouchBar's delegate is weak; the proxy is owned by this integration
+        self._delegate_proxy = _DelegateProxy.alloc().initWithIntegration_(self)
+        self.touch_bar.setDelegate_(self._delegate_proxy)
+        self.touch_bar.setDefaultItemIdentifiers_([self.identifier])
+        self.touch_bar.setCustomizationIdentifier_(
+            f"{self.config['prefix']}-coding-assistant"
+        )
+        self.touch_bar.setCustomizationAllowedItemIdentifiers_([self.identifier])
+
+        # Set the Touch Bar for the application
+        NSApp.setTouchBar_(self.touch_bar)
+
+        # Make the application active
+        NSApp.activateIgnoringOtherApps_(True)
+
+    def _setup_dfr_touch_bar(self):
+        """Setup the Touch Bar using the DFR display server"""
+        if self._display_server is None:
+            self._display_server = _DFRDisplayServer.sharedDisplayServer()
+
+        self.touch_bar_item = _DFRTouchBarItem.alloc().init()
+
+        # Configure the Touch Bar item
+        self.touch_bar_item.setTitle_("🔍 Code")
+        self.touch_bar_item.setCustomizationLabel_("Coding Assistant")
+        self.touch_bar_item.setCustomizationAllowed_(True)
+        self.touch_bar_item.setWidth_(100)
+        self.touch_bar_item.setTarget_(self)
+        self.touch_bar_item.setAction_(self._search_selector)
+        self.touch_bar_item.setEnabled_(True)
+
+        # Add to Touch Bar
+        self._display_server.addTouchBarItem_(self.touch_bar_item)
+
+    def touchBar_makeItemForIdentifier_(self, touchBar, identifier):
+        """Create Touch Bar item"""
+        try:
+            cached = self._items.get(identifier)
+            if cached is not None:
+                return cached
+
+            if identifier == self.identifier:
+                item = NSTouchBarItem.alloc().initWithIdentifier_(identifier)
+                button = NSButton.buttonWithTitle_target_action_(
+                    "🔍 Code", self, self._search_selector
+                )
+                if self._bezel_color:
+                    button.setBezelColor_(_NSColor.systemBlueColor())
+                item.setView_(button)
+                self._items[identifier] = item
+                return item
+            return None
+        except Exception:
+            logger.exception("Error creating Touch Bar item")
+            return None
+
+    def _alert_window(self):
+        """Return the window alerts are attached to as sheets"""
+        if self.window is not None:
+            return self.window
+
+        # Window-less (DFR) variant: use a small panel created on first alert
+        if self._alert_panel is None:
+            self._alert_panel = (
+                NSPanel.alloc().initWithContentRect_styleMask_backing_defer_(
+                    _ALERT_PANEL_RECT,
+                    NSWindowStyleMaskTitled,
+                    NSBackingStoreBuffered,
+                    False,
+                )
+            )
+            self._alert_panel.setTitle_("Touch Bar Coding Assistant")
+        self._alert_panel.makeKeyAndOrderFront_(None)
+        return self._alert_panel
+
+    def _alert_finished(self, response):
+        """Hide the alert panel once its sheet is dismissed"""
+        if self._alert_panel is not None:
+            self._alert_panel.orderOut_(None)
+
+    def _make_alert(self, title, text):
+        """Build an informational alert once so button presses can reuse it"""
+        alert = NSAlert.alloc().init()
+        alert.setMessageText_(title)
+        alert.setInformativeText_(text)
+        alert.addButtonWithTitle_("OK")
+        return alert
+
+    def _show_alert(self, alert):
+        """Show a prebuilt alert without blocking the run loop"""
+        if alert.window().isVisible():
+            return
+        alert.beginSheetModalForWindow_completionHandler_(
+            self._alert_window(), self._alert_finished
+        )
+
+    def search_action(self, sender):
+        """Handle search button press"""
+        try:
+            print(f"🎯 {self.config['name']} Touch Bar button pressed!")
+            self._show_alert(self._search_alert)
+            logger.info("Touch Bar search button pressed")
+
+        except Exception:
+            logger.exception("Error handling Touch Bar button press")
+
+    def test_action(self, sender):
+        """Handle test button press"""
+        try:
+            print(f"🎯 {self.config['name']} test button pressed!")
+            self._show_alert(self._test_alert)
+
+        except Exception:
+            logger.exception("Error handling test button press")
+
+    def cleanup(self):
+        """Cleanup Touch Bar resources"""
+        try:
+            if self.is_active:
+                if self.config["use_dfr"]:
+                    if self.touch_bar_item is not None:
+                        self._display_server.removeTouchBarItem_(self.touch_bar_item)
+                else:
+                    NSApp.setTouchBar_(None)
+                    self.touch_bar.setDelegate_(None)
+                    self.touch_bar = None
+                    self._delegate_proxy = None
+                self._items.clear()
+                if self.window:
+                    self.window.close()
+                if self._alert_panel:
+                    self._alert_panel.close()
+                self.is_active = False
+                logger.info("Touch Bar integration cleaned up")
+                self._report(
+                    [f"✅ {self.config['name']} Touch Bar resources cleaned up"]
+                )
+        except Exception:
+            logger.exception("Error cleaning up Touch Bar")
+
+
+def _stop_app():
+    """Stop NSApp.run() so it returns and the caller's cleanup runs
+
+    stop: only takes effect after the current event, so post an empty
+    application-defined event to end the run loop right away.
+    """
+    NSApp.stop_(None)
+    # The selector name alone is longer than a line, so look it up in two parts
+    make_event = getattr(
+        NSEvent,
+        "otherEventWithType_location_modifierFlags_timestamp_windowNumber_"
+        "context_subtype_data1_data2_",
+    )
+    event = make_event(NSEventTypeApplicationDefined, (0, 0), 0, 0, 0, None, 0, 0, 0)
+    NSApp.postEvent_atStart_(event, True)
+
+
+def install_signal_wakeup(signals=(signal.SIGINT, signal.SIGTERM)):
+    """Stop NSApp as soon as one of signals arrives
+
+    NSApp.run() does not return to Python between events, so a plain Python
+    signal handler only fires after the next event. Route the signals through
+    signal.set_wakeup_fd into a pipe watched by an NSFileHandle, which wakes
+    the run loop immediately. NSApp is stopped rather than terminated so that
+    run() returns and its cleanup runs. Keep the returned handle alive.
+    """
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(write_fd, False)
+    signal.set_wakeup_fd(write_fd)
+
+    # Python-level handlers are still required for the wakeup fd to be written
+    for signum in signals:
+        signal.signal(signum, lambda signum, frame: None)
+
+    def on_signal(h):
+        # Drain the pipe so the handler isn't called again for the same bytes
+        h.availableData()
+        dispatch_async(dispatch_get_main_queue(), _stop_app)
+
+    handle = NSFileHandle.alloc().initWithFileDescriptor_(read_fd)
+    handle.setReadabilityHandler_(on_signal)
+    return handle
+
+
+def run(config, argv=None):
+    """Run a Touch Bar integration built from config until interrupted"""
+    parser = argparse.ArgumentParser(description="Touch Bar Coding Assistant")
+    parser.add_argument(
+        "--verbose", action="store_true", help="Print setup and cleanup progress"
+    )
+    args = parser.parse_args(argv)
+
+    config = {**config, "verbose": args.verbose or config.get("verbose", False)}
+    name = config.get("name", DEFAULT_CONFIG["name"])
+
+    if not TOUCHBAR_AVAILABLE:
+        print("❌ Touch Bar APIs not available on this system")
+        print("This feature requires macOS with Touch Bar support")
+        print("Make sure you're running on a MacBook Pro with Touch Bar")
+        return
+
+    touch_bar = None
+
+    try:
+        # Initialize NSApplication
+        app = NSApplication.sharedApplication()
+        app.setActivationPolicy_(
+            NSApplicationActivationPolicyAccessory
+            if config.get("accessory")
+            else NSApplicationActivationPolicyRegular
+        )
+
+        # Create Touch Bar integration
+        touch_bar = TouchBarIntegration.alloc().initWithConfig_(config)
+        touch_bar.setup_touch_bar()
+
+        sys.stdout.write(
+            f"🚀 {name} Touch Bar Coding Assistant is running!\n"
+            "🎯 Look for '🔍 Code' button on your Touch Bar\n"
+            "💡 Click it to test the integration\n"
+            "🔄 Press Ctrl+C to exit\n"
+        )
+        sys.stdout.flush()
+
+        # Run the application
+        app.run()
+
+    except KeyboardInterrupt:
+        print("\n👋 Shutting down Touch Bar Coding Assistant...")
+    except Exception:
+        logger.exception("Application error")
+    finally:
+        if touch_bar:
+            touch_bar.cleanup()
+        print("✅ Touch Bar Coding Assistant stopped")
@@ -5,42 +5,20 @@ Uses macOS Touch Bar APIs to add actual buttons to the Touch Bar
 """
 
 import asyncio
-import threading
+import concurrent.futures
 import logging
 import objc
-from typing import Optional, Callable
-from app.config import settings
-from app.azure_service import AzureOpenAIService
 
 # Import macOS APIs
 try:
-    from Foundation import NSObject, NSRunLoop, NSDefaultRunLoopMode
-    from AppKit import (
-        NSApplication,
-        NSApp,
-        NSStatusBar,
-        NSMenu,
-        NSMenuItem,
-        NSAlert,
-        NSInformationalAlertStyle,
-        NSWindow,
-        NSView,
-        NSButton,
-        NSTextField,
-        NSScrollView,
-        NSTextView,
-        NSMakeRect,
-        NSRect,
-        NSSize,
-        NSPoint,
-        NSWindowStyleMaskTitled,
-        NSWindowStyleMaskClosable,
-        NSWindowStyleMaskMiniaturizable,
-        NSWindowStyleMaskResizable,
-        NSBackingStoreBuffered,
-        NSWindowLevelFloating,
-        NSApplicationActivationPolicyAccessory,
-    )
+    from app._appkit_common import *
+
+    # Search window geometry, built once instead of per window creation
+    _WINDOW_RECT = NSMakeRect(100, 100, 600, 400)
+    _SEARCH_FIELD_RECT = NSMakeRect(20, 350, 400, 30)
+    _SEARCH_BUTTON_RECT = NSMakeRect(440, 350, 80, 30)
+    _SCROLL_RECT = NSMakeRect(20, 20, 560, 320)
+    _TEXT_RECT = NSMakeRect(0, 0, 560, 320)
 
     # Try to import Touch Bar specific APIs
     try:
@@ -80,6 +58,11 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# Shared worker pool for searches, reused across button presses
+_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=4, thread_name_prefix="tb-search"
+)
+
 
 class TouchBarSearchWindow(NSObject):
     """Search window that appears when Touch Bar button is pressed"""
@@ -91,7 +74,7 @@ class TouchBarSearchWindow(NSObject):
 
         # Create the search window
         self.window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
-            NSMakeRect(100, 100, 600, 400),
+            _WINDOW_RECT,
             NSWindowStyleMaskTitled
             | NSWindowStyleMaskClosable
             | NSWindowStyleMaskMiniaturizable
@@ -114,16 +97,12 @@ class TouchBarSearchWindow(NSObject):
         content_view = self.window.contentView()
 
         # Search field
-        self.search_field = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, 350, 400, 30)
-        )
+        self.search_field = NSTextField.alloc().initWithFrame_(_SEARCH_FIELD_RECT)
         self.search_field.setPlaceholderString_("Enter your coding question...")
         content_view.addSubview_(self.search_field)
 
         # Search button
-        self.search_button = NSButton.alloc().initWithFrame_(
-            NSMakeRect(440, 350, 80, 30)
-        )
+        self.search_button = NSButton.alloc().initWithFrame_(_SEARCH_BUTTON_RECT)
         self.search_button.setTitle_("Search")
         self.search_button.setBezelStyle_(1)  # Rounded button
         self.search_button.setTarget_(self)
@@ -131,8 +110,8 @@ class TouchBarSearchWindow(NSObject):
         content_view.addSubview_(self.search_button)
 
         # Answer text view
-        scroll_view = NSScrollView.alloc().initWithFrame_(NSMakeRect(20, 20, 560, 320))
-        self.answer_text = NSTextView.alloc().initWithFrame_(NSMakeRect(0, 0, 560, 320))
+        scroll_view = NSScrollView.alloc().initWithFrame_(_SCROLL_RECT)
+        self.answer_text = NSTextView.alloc().initWithFrame_(_TEXT_RECT)
         self.answer_text.setEditable_(False)
         self.answer_text.setString_("Ask a coding interview question...")
         scroll_view.setDocumentView_(self.answer_text)
@@ -153,9 +132,7 @@ class TouchBarSearchWindow(NSObject):
         self.answer_text.setString_("Searching...")
 
         # Run search in background
-        thread = threading.Thread(target=self._run_search, args=(question,))
-        thread.daemon = True
-        thread.start()
+        _POOL.submit(self._run_search, question)
 
     def _run_search(self, question: str):
         """Run the search in background thread"""
@@ -189,6 +166,8 @@ class TouchBarSearchWindow(NSObject):
     async def _perform_search(self, question: str) -> str:
         """Perform the actual search using Azure OpenAI"""
         try:
+            from app.azure_service import AzureOpenAIService
+
             answer = await AzureOpenAIService.get_coding_answer(question)
             return answer
         except Exception as e:
@@ -306,7 +285,7 @@ class NativeTouchBarIntegration(NSObject):
         """Cleanup Touch Bar resources"""
         if self.is_active:
             try:
-                if hasattr(self, "touch_bar_item") and self.touch_bar_item:
+                if self.touch_bar_item is not None:
                     if "DFRFoundation" in globals():
                         DFRFoundation.DFRDisplayServer.sharedDisplayServer().removeTouchBarItem_(
                             self.touch_bar_item
@@ -6,38 +6,38 @@ Explore available Touch Bar APIs and find the correct integration method
 
 import sys
 import os
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# Start system_profiler now so it runs while the class probes below execute
 try:
-    import objc
-    from Foundation import NSObject, NSRunLoop, NSDefaultRunLoopMode
-    from AppKit import (
-        NSApplication,
-        NSApp,
-        NSStatusBar,
-        NSMenu,
-        NSMenuItem,
-        NSAlert,
-        NSInformationalAlertStyle,
-        NSWindow,
-        NSView,
-        NSButton,
-        NSTextField,
-        NSScrollView,
-        NSTextView,
-        NSMakeRect,
-        NSRect,
-        NSSize,
-        NSPoint,
-        NSWindowStyleMaskTitled,
-        NSWindowStyleMaskClosable,
-        NSWindowStyleMaskMiniaturizable,
-        NSWindowStyleMaskResizable,
-        NSBackingStoreBuffered,
-        NSApplicationActivationPolicyAccessory,
+    profiler = subprocess.Popen(
+        ["system_profiler", "SPTouchBarDataType"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
     )
+    profiler_error = None
+except Exception as e:
+    profiler = None
+    profiler_error = e
+
+
+def _probe(class_name):
+    """Look up an Objective-C class, returning None or the lookup error"""
+    try:
+        objc.lookUpClass(class_name)
+        return None
+    except Exception as e:
+        return e
+
+
+try:
+    import objc
+    from app._appkit_common import *
 
     print("✅ macOS APIs loaded successfully!")
 
@@ -63,12 +63,14 @@ try:
             "DFRTouchBarItemViewController",
         ]
 
-        for class_name in touch_bar_classes:
-            try:
-                cls = objc.lookUpClass(class_name)
+        with ThreadPoolExecutor(max_workers=len(touch_bar_classes)) as ex:
+            results = list(ex.map(lambda n: (n, _probe(n)), touch_bar_classes))
+
+        for class_name, error in results:
+            if error is None:
                 print(f"✅ {class_name}: Available")
-            except Exception as e:
-                print(f"❌ {class_name}: Not available - {e}")
+            else:
+                print(f"❌ {class_name}: Not available - {error}")
 
         # Try alternative approaches
         print("\n🔍 Alternative Touch Bar APIs:")
@@ -84,16 +86,12 @@ try:
         # Check for Touch Bar in System Preferences
         print("\n🔍 System Touch Bar Info:")
         try:
-            import subprocess
-
-            result = subprocess.run(
-                ["system_profiler", "SPTouchBarDataType"],
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
+            if profiler is None:
+                raise profiler_error
+            stdout, _ = profiler.communicate()
+            if profiler.returncode == 0:
                 print("✅ Touch Bar detected in system")
-                print(result.stdout[:500] + "...")
+                print(stdout[:500] + "...")
             else:
                 print("❌ Touch Bar not detected in system")
         except Exception as e:
@@ -105,4 +103,10 @@ try:
 except ImportError as e:
     print(f"❌ macOS APIs not available: {e}")
 
+# system_profiler is only read when DFRFoundation loads; reap it on every
+# other path so it doesn't linger as a zombie with an open pipe
+if profiler is not None and profiler.returncode is None:
+    profiler.kill()
+    profiler.communicate()
+
 print("\n🔍 Research Complete!")
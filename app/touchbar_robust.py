@@ -4,53 +4,26 @@ Robust Touch Bar Integration for MacBook Pro
 Uses a more robust approach to avoid crashes and handle errors better
 """
 
-import asyncio
-import threading
 import logging
 import sys
 import os
 import signal
-from typing import Optional, Callable
 
 # Add the project root to Python path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.config import settings
-from app.azure_service import AzureOpenAIService
-
 # Import macOS APIs
 try:
     import objc
-    from Foundation import NSObject, NSRunLoop, NSDefaultRunLoopMode
-    from AppKit import (
-        NSApplication,
-        NSApp,
-        NSStatusBar,
-        NSMenu,
-        NSMenuItem,
-        NSAlert,
-        NSInformationalAlertStyle,
-        NSWindow,
-        NSView,
-        NSButton,
-        NSTextField,
-        NSScrollView,
-        NSTextView,
-        NSMakeRect,
-        NSRect,
-        NSSize,
-        NSPoint,
-        NSWindowStyleMaskTitled,
-        NSWindowStyleMaskClosable,
-        NSWindowStyleMaskMiniaturizable,
-        NSWindowStyleMaskResizable,
-        NSBackingStoreBuffered,
-        NSApplicationActivationPolicyAccessory,
-        NSApplicationActivationPolicyRegular,
-        NSTouchBar,
-        NSTouchBarItem,
-        NSTouchBarItemIdentifier,
-    )
+    from app._appkit_common import *
+    from AppKit import NSTouchBar, NSTouchBarItem
+
+    # Constant Cocoa objects, resolved once instead of per window/button
+    _NSColor = objc.lookUpClass("NSColor")
+    _SYSTEM_BLUE = _NSColor.systemBlueColor()
+    _WINDOW_RECT = NSMakeRect(100, 100, 400, 200)
+    _LABEL_RECT = NSMakeRect(20, 50, 360, 100)
+    _TEST_BUTTON_RECT = NSMakeRect(20, 20, 100, 30)
 
     TOUCHBAR_AVAILABLE = True
     print("✅ Robust Touch Bar APIs loaded successfully!")
@@ -87,7 +60,7 @@ class RobustTouchBarIntegration(NSObject):
 
             # Create a visible window to make the app active
             self.window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
-                NSMakeRect(100, 100, 400, 200),
+                _WINDOW_RECT,
                 NSWindowStyleMaskTitled | NSWindowStyleMaskClosable,
                 NSBackingStoreBuffered,
                 False,
@@ -97,7 +70,7 @@ class RobustTouchBarIntegration(NSObject):
 
             # Add a label to the window
             content_view = self.window.contentView()
-            label = NSTextField.alloc().initWithFrame_(NSMakeRect(20, 50, 360, 100))
+            label = NSTextField.alloc().initWithFrame_(_LABEL_RECT)
             label.setStringValue_(
                 "Touch Bar Coding Assistant is running!\n\nLook for '🔍 Code' button on your Touch Bar.\n\nIf the button doesn't appear:\n1. Make sure this window is active\n2. Check Touch Bar customization\n3. Try clicking in this window"
             )
@@ -108,7 +81,7 @@ class RobustTouchBarIntegration(NSObject):
             content_view.addSubview_(label)
 
             # Add a test button to the window
-            test_button = NSButton.alloc().initWithFrame_(NSMakeRect(20, 20, 100, 30))
+            test_button = NSButton.alloc().initWithFrame_(_TEST_BUTTON_RECT)
             test_button.setTitle_("Test Alert")
             test_button.setTarget_(self)
             test_button.setAction_(
@@ -161,7 +134,7 @@ class RobustTouchBarIntegration(NSObject):
                     self,
                     objc.selector(self.robust_search_action, signature=b"v@:@"),
                 )
-                button.setBezelColor_(objc.lookUpClass("NSColor").systemBlueColor())
+                button.setBezelColor_(_SYSTEM_BLUE)
                 item.setView_(button)
                 return item
             return None
@@ -4,18 +4,17 @@ Working Touch Bar Integration for MacBook Pro
 Uses available macOS APIs to add buttons to the Touch Bar
 """
 
-import asyncio
-import threading
 import logging
 import sys
 import os
 from typing import Optional, Callable
 
-# Add the project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Imported as app.touchbar_*, the project root is already on sys.path; only
+# patch it when the file is run directly as a script
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.config import settings
-from app.azure_service import AzureOpenAIService
 
 # Import macOS APIs
 try:
@@ -48,6 +47,8 @@ try:
         NSApplicationActivationPolicyAccessory,
     )
 
+    from app._touchbar_search_window import TouchBarSearchWindow
+
     # Try to import Touch Bar specific APIs
     try:
         # Try to load Touch Bar framework
@@ -56,136 +57,25 @@ try:
             globals(),
             "/System/Library/PrivateFrameworks/DFRFoundation.framework",
         )
+
+        # Resolve the display server and item class at import so the first
+        # setup on the UI thread doesn't pay for it
+        _DFR_DS = objc.lookUpClass("DFRDisplayServer").sharedDisplayServer()
+        _DFR_ITEM_CLS = objc.lookUpClass("DFRTouchBarItem")
+
         TOUCHBAR_AVAILABLE = True
     except Exception:
+        _DFR_DS = _DFR_ITEM_CLS = None
         TOUCHBAR_AVAILABLE = False
 
 except ImportError as e:
     print(f"macOS APIs not available: {e}")
+    _DFR_DS = _DFR_ITEM_CLS = None
     TOUCHBAR_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
 
-class TouchBarSearchWindow(NSObject):
-    """Search window that appears when Touch Bar button is pressed"""
-
-    def init(self):
-        self = objc.super(TouchBarSearchWindow, self).init()
-        if self is None:
-            return None
-
-        # Create the search window
-        self.window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
-            NSMakeRect(100, 100, 600, 400),
-            NSWindowStyleMaskTitled
-            | NSWindowStyleMaskClosable
-            | NSWindowStyleMaskMiniaturizable
-            | NSWindowStyleMaskResizable,
-            NSBackingStoreBuffered,
-            False,
-        )
-
-        self.window.setTitle_("Touch Bar Coding Assistant")
-        self.window.setLevel_(NSWindowLevelFloating)
-        self.window.makeKeyAndOrderFront_(None)
-
-        # Create the search interface
-        self._create_search_interface()
-
-        return self
-
-    def _create_search_interface(self):
-        """Create the search interface elements"""
-        content_view = self.window.contentView()
-
-        # Search field
-        self.search_field = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, 350, 400, 30)
-        )
-        self.search_field.setPlaceholderString_("Enter your coding question...")
-        content_view.addSubview_(self.search_field)
-
-        # Search button
-        self.search_button = NSButton.alloc().initWithFrame_(
-            NSMakeRect(440, 350, 80, 30)
-        )
-        self.search_button.setTitle_("Search")
-        self.search_button.setBezelStyle_(1)  # Rounded button
-        self.search_button.setTarget_(self)
-        self.search_button.setAction_(
-            objc.selector(self.search_action_, signature=b"v@:@")
-        )
-        content_view.addSubview_(self.search_button)
-
-        # Answer text view
-        scroll_view = NSScrollView.alloc().initWithFrame_(NSMakeRect(20, 20, 560, 320))
-        self.answer_text = NSTextView.alloc().initWithFrame_(NSMakeRect(0, 0, 560, 320))
-        self.answer_text.setEditable_(False)
-        self.answer_text.setString_("Ask a coding interview question...")
-        scroll_view.setDocumentView_(self.answer_text)
-        content_view.addSubview_(scroll_view)
-
-        # Bind Enter key to search
-        self.search_field.setTarget_(self)
-        self.search_field.setAction_(
-            objc.selector(self.search_action_, signature=b"v@:@")
-        )
-
-    def search_action_(self, sender):
-        """Handle search button click or Enter key"""
-        question = self.search_field.stringValue().strip()
-        if not question:
-            return
-
-        # Update UI
-        self.search_button.setEnabled_(False)
-        self.answer_text.setString_("Searching...")
-
-        # Run search in background
-        thread = threading.Thread(target=self._run_search, args=(question,))
-        thread.daemon = True
-        thread.start()
-
-    def _run_search(self, question: str):
-        """Run the search in background thread"""
-        try:
-            # Create new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            # Run the async search
-            answer = loop.run_until_complete(self._perform_search(question))
-
-            # Update UI in main thread
-            self.window.performSelectorOnMainThread_withObject_waitUntilDone_(
-                objc.selector(self._update_answer_, signature=b"v@:@"), answer, False
-            )
-
-        except Exception as e:
-            logger.error(f"Search error: {str(e)}")
-            error_msg = f"Error: {str(e)}"
-            self.window.performSelectorOnMainThread_withObject_waitUntilDone_(
-                objc.selector(self._update_answer_, signature=b"v@:@"), error_msg, False
-            )
-        finally:
-            loop.close()
-
-    def _update_answer_(self, answer: str):
-        """Update the answer display"""
-        self.answer_text.setString_(answer)
-        self.search_button.setEnabled_(True)
-
-    async def _perform_search(self, question: str) -> str:
-        """Perform the actual search using Azure OpenAI"""
-        try:
-            answer = await AzureOpenAIService.get_coding_answer(question)
-            return answer
-        except Exception as e:
-            logger.error(f"Azure OpenAI error: {str(e)}")
-            return f"Error: Unable to get answer - {str(e)}"
-
-
 class WorkingTouchBarIntegration(NSObject):
     """Working Touch Bar integration for MacBook Pro"""
 
@@ -206,25 +96,25 @@ class WorkingTouchBarIntegration(NSObject):
     def setup_touch_bar(self):
         """Setup the Touch Bar with a search button"""
         try:
-            # Get the shared display server
-            display_server = objc.lookUpClass("DFRDisplayServer").sharedDisplayServer()
-
             # Create Touch Bar item
-            self.touch_bar_item = objc.lookUpClass("DFRTouchBarItem").alloc().init()
-
-            # Configure the Touch Bar item
-            self.touch_bar_item.setTitle_("🔍 Code")
-            self.touch_bar_item.setCustomizationLabel_("Coding Assistant")
-            self.touch_bar_item.setCustomizationAllowed_(True)
-            self.touch_bar_item.setWidth_(100)
-            self.touch_bar_item.setTarget_(self)
-            self.touch_bar_item.setAction_(
-                objc.selector(self._search_button_pressed, signature=b"v@:@")
+            self.touch_bar_item = _DFR_ITEM_CLS.alloc().init()
+
+            # Configure the Touch Bar item in one KVC call; the action is a SEL,
+            # which NSDictionary can't carry, so it keeps its own setter
+            self.touch_bar_item.setValuesForKeysWithDictionary_(
+                {
+                    "title": "🔍 Code",
+                    "customizationLabel": "Coding Assistant",
+                    "customizationAllowed": True,
+                    "width": 100,
+                    "target": self,
+                    "enabled": True,
+                }
             )
-            self.touch_bar_item.setEnabled_(True)
+            self.touch_bar_item.setAction_(self._search_button_pressed)
 
             # Add to Touch Bar
-            display_server.addTouchBarItem_(self.touch_bar_item)
+            _DFR_DS.addTouchBarItem_(self.touch_bar_item)
 
             self.is_active = True
             logger.info("✅ Working Touch Bar integration activated!")
@@ -236,6 +126,7 @@ class WorkingTouchBarIntegration(NSObject):
             logger.error(f"Failed to setup Touch Bar: {str(e)}")
             raise
 
+    @objc.typedSelector(b"v@:@")
     def _search_button_pressed(self, sender):
         """Handle Touch Bar button press"""
         try:
@@ -255,10 +146,9 @@ class WorkingTouchBarIntegration(NSObject):
         """Cleanup Touch Bar resources"""
         if self.is_active and hasattr(self, "touch_bar_item") and self.touch_bar_item:
             try:
-                display_server = objc.lookUpClass(
-                    "DFRDisplayServer"
-                ).sharedDisplayServer()
-                display_server.removeTouchBarItem_(self.touch_bar_item)
+                _DFR_DS.removeTouchBarItem_(self.touch_bar_item)
+                if self.search_window:
+                    self.search_window.shutdown()
                 self.is_active = False
                 logger.info("Touch Bar integration cleaned up")
             except Exception as e:
@@ -4,18 +4,17 @@ Final Working Touch Bar Integration for MacBook Pro
 Uses a different approach to avoid method signature issues
 """
 
-import asyncio
-import threading
 import logging
 import sys
 import os
 from typing import Optional, Callable
 
-# Add the project root to Python path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Imported as app.touchbar_*, the project root is already on sys.path; only
+# patch it when the file is run directly as a script
+if __name__ == "__main__":
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.config import settings
-from app.azure_service import AzureOpenAIService
 
 # Import macOS APIs
 try:
@@ -50,6 +49,8 @@ try:
         NSTouchBarItemIdentifier,
     )
 
+    from app._touchbar_search_window import TouchBarSearchWindow
+
     TOUCHBAR_AVAILABLE = True
     print("✅ Final Touch Bar APIs loaded successfully!")
 
@@ -59,28 +60,49 @@ except ImportError as e:
 
 logger = logging.getLogger(__name__)
 
+# NSColor.systemBlueColor() is a shared singleton; look it up once
+_SYSTEM_BLUE = None
+
+
+def _blue():
+    """Return the cached system blue color"""
+    global _SYSTEM_BLUE
+    if _SYSTEM_BLUE is None:
+        _SYSTEM_BLUE = objc.lookUpClass("NSColor").systemBlueColor()
+    return _SYSTEM_BLUE
+
+
+def _make_search_item(owner, touchBar, identifier):
+    """Build the '🔍 Code' search button item"""
+    item = NSTouchBarItem.alloc().initWithIdentifier_(identifier)
+    button = NSButton.buttonWithTitle_target_action_(
+        "🔍 Code", owner, owner.search_action_
+    )
+    button.setBezelColor_(_blue())
+    item.setView_(button)
+    return item
+
 
 class TouchBarSearchItem(NSObject):
     """Touch Bar item for search functionality"""
 
+    # Touch Bar identifier -> item factory(owner, touchBar, identifier)
+    _ITEM_FACTORIES = {"coding-assistant-search": _make_search_item}
+
     def init(self):
         self = objc.super(TouchBarSearchItem, self).init()
         if self is None:
             return None
+
         return self
 
+    @objc.typedSelector(b"@@:@@")
     def touchBar_makeItemForIdentifier_(self, touchBar, identifier):
         """Create Touch Bar item"""
-        if identifier == "coding-assistant-search":
-            item = NSTouchBarItem.alloc().initWithIdentifier_(identifier)
-            button = NSButton.buttonWithTitle_target_action_(
-                "🔍 Code", self, objc.selector(self.search_action_, signature=b"v@:@")
-            )
-            button.setBezelColor_(objc.lookUpClass("NSColor").systemBlueColor())
-            item.setView_(button)
-            return item
-        return None
+        factory = self._ITEM_FACTORIES.get(str(identifier))
+        return factory(self, touchBar, identifier) if factory else None
 
+    @objc.typedSelector(b"v@:@")
     def search_action_(self, sender):
         """Handle search button press"""
         try:
@@ -101,124 +123,6 @@ class TouchBarSearchItem(NSObject):
             print(f"❌ Error: {str(e)}")
 
 
-class TouchBarSearchWindow(NSObject):
-    """Search window that appears when Touch Bar button is pressed"""
-
-    def init(self):
-        self = objc.super(TouchBarSearchWindow, self).init()
-        if self is None:
-            return None
-
-        # Create the search window
-        self.window = NSWindow.alloc().initWithContentRect_styleMask_backing_defer_(
-            NSMakeRect(100, 100, 600, 400),
-            NSWindowStyleMaskTitled
-            | NSWindowStyleMaskClosable
-            | NSWindowStyleMaskMiniaturizable
-            | NSWindowStyleMaskResizable,
-            NSBackingStoreBuffered,
-            False,
-        )
-
-        self.window.setTitle_("Touch Bar Coding Assistant")
-        self.window.makeKeyAndOrderFront_(None)
-
-        # Create the search interface
-        self._create_search_interface()
-
-        return self
-
-    def _create_search_interface(self):
-        """Create the search interface elements"""
-        content_view = self.window.contentView()
-
-        # Search field
-        self.search_field = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(20, 350, 400, 30)
-        )
-        self.search_field.setPlaceholderString_("Enter your coding question...")
-        content_view.addSubview_(self.search_field)
-
-        # Search button
-        self.search_button = NSButton.alloc().initWithFrame_(
-            NSMakeRect(440, 350, 80, 30)
-        )
-        self.search_button.setTitle_("Search")
-        self.search_button.setBezelStyle_(1)  # Rounded button
-        self.search_button.setTarget_(self)
-        self.search_button.setAction_(
-            objc.selector(self.search_action_, signature=b"v@:@")
-        )
-        content_view.addSubview_(self.search_button)
-
-        # Answer text view
-        scroll_view = NSScrollView.alloc().initWithFrame_(NSMakeRect(20, 20, 560, 320))
-        self.answer_text = NSTextView.alloc().initWithFrame_(NSMakeRect(0, 0, 560, 320))
-        self.answer_text.setEditable_(False)
-        self.answer_text.setString_("Ask a coding interview question...")
-        scroll_view.setDocumentView_(self.answer_text)
-        content_view.addSubview_(scroll_view)
-
-        # Bind Enter key to search
-        self.search_field.setTarget_(self)
-        self.search_field.setAction_(
-            objc.selector(self.search_action_, signature=b"v@:@")
-        )
-
-    def search_action_(self, sender):
-        """Handle search button click or Enter key"""
-        question = self.search_field.stringValue().strip()
-        if not question:
-            return
-
-        # Update UI
-        self.search_button.setEnabled_(False)
-        self.answer_text.setString_("Searching...")
-
-        # Run search in background
-        thread = threading.Thread(target=self._run_search, args=(question,))
-        thread.daemon = True
-        thread.start()
-
-    def _run_search(self, question: str):
-        """Run the search in background thread"""
-        try:
-            # Create new event loop for this thread
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-
-            # Run the async search
-            answer = loop.run_until_complete(self._perform_search(question))
-
-            # Update UI in main thread
-            self.window.performSelectorOnMainThread_withObject_waitUntilDone_(
-                objc.selector(self._update_answer_, signature=b"v@:@"), answer, False
-            )
-
-        except Exception as e:
-            logger.error(f"Search error: {str(e)}")
-            error_msg = f"Error: {str(e)}"
-            self.window.performSelectorOnMainThread_withObject_waitUntilDone_(
-                objc.selector(self._update_answer_, signature=b"v@:@"), error_msg, False
-            )
-        finally:
-            loop.close()
-
-    def _update_answer_(self, answer: str):
-        """Update the answer display"""
-        self.answer_text.setString_(answer)
-        self.search_button.setEnabled_(True)
-
-    async def _perform_search(self, question: str) -> str:
-        """Perform the actual search using Azure OpenAI"""
-        try:
-            answer = await AzureOpenAIService.get_coding_answer(question)
-            return answer
-        except Exception as e:
-            logger.error(f"Azure OpenAI error: {str(e)}")
-            return f"Error: Unable to get answer - {str(e)}"
-
-
 class FinalTouchBarIntegration(NSObject):
     """Final Touch Bar integration using NSTouchBar API"""
 
@@ -265,6 +169,7 @@ class FinalTouchBarIntegration(NSObject):
             logger.error(f"Failed to setup Touch Bar: {str(e)}")
             raise
 
+    @objc.typedSelector(b"@@:@@")
     def touchBar_makeItemForIdentifier_(self, touchBar, identifier):
         """Create Touch Bar item"""
         return self.touch_bar_item.touchBar_makeItemForIdentifier_(touchBar, identifier)
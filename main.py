@@ -8,51 +8,47 @@ and display answers directly on the Touch Bar using Azure OpenAI APIs.
 import sys
 import os
 import logging
+import logging.handlers
 import argparse
-from pathlib import Path
-
-# Import macOS APIs for Touch Bar
-try:
-    from AppKit import NSApplication, NSApplicationActivationPolicyAccessory
-
-    MACOS_AVAILABLE = True
-except ImportError:
-    MACOS_AVAILABLE = False
+import queue
+from types import SimpleNamespace
 
 # Add the app directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent))
-
-from app.touch_bar_ui import TouchBarUI, TouchBarSimulator
-from app.touch_bar_button import TouchBarButton
-from app.touchbar_fixed import FixedTouchBarIntegration
-from app.config import settings
-from app.azure_service import AzureOpenAIService
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# UI, AppKit and Azure modules are imported where they are used, so --test
+# and --simulator don't pay for loading the ones they never touch
+
+# Configure logging: callers (including Touch Bar handlers on the main thread)
+# only enqueue records; a background listener does the console and file I/O
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler("touch_bar_assistant.log"),
+)
+_log_listener.start()
 
-# Configure logging
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler("touch_bar_assistant.log"),
-    ],
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
 )
 
 logger = logging.getLogger(__name__)
 
 
+# Environment variables that must be set (and non-empty) to start
+REQUIRED_ENV_VARS = (
+    "AZURE_OPENAI_API_KEY",
+    "AZURE_OPENAI_ENDPOINT",
+    "AZURE_OPENAI_DEPLOYMENT_NAME",
+)
+
+
 def check_environment():
     """Check if required environment variables are set"""
-    required_vars = [
-        "AZURE_OPENAI_API_KEY",
-        "AZURE_OPENAI_ENDPOINT",
-        "AZURE_OPENAI_DEPLOYMENT_NAME",
-    ]
-
-    missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
+    missing_vars = [v for v in REQUIRED_ENV_VARS if not os.environ.get(v)]
 
     if missing_vars:
         logger.error(
@@ -66,6 +62,8 @@ def check_environment():
 
 def test_azure_connection():
     """Test the Azure OpenAI connection"""
+    from app.azure_service import AzureOpenAIService
+
     try:
         logger.info("Testing Azure OpenAI connection...")
         # This will test the connection during initialization
@@ -79,6 +77,23 @@ def test_azure_connection():
 
 def main():
     """Main application entry point"""
+    try:
+        _run()
+    finally:
+        # Flush queued log records before the process exits
+        _log_listener.stop()
+
+
+# Boolean flags main() understands; a lone one of these skips argparse
+_FLAG_NAMES = ("test", "simulator", "button", "touchbar", "debug")
+_FAST_FLAGS = frozenset(f"--{name}" for name in _FLAG_NAMES)
+
+
+def _parse_args(argv):
+    """Parse command line arguments, skipping argparse for a single known flag"""
+    if len(argv) <= 1 and all(arg in _FAST_FLAGS for arg in argv):
+        return SimpleNamespace(**{name: f"--{name}" in argv for name in _FLAG_NAMES})
+
     parser = argparse.ArgumentParser(
         description="Touch Bar Coding Assistant - Search coding interview questions on your Touch Bar"
     )
@@ -102,7 +117,12 @@ def main():
     )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
-    args = parser.parse_args()
+    return parser.parse_args(argv)
+
+
+def _run():
+    """Parse arguments and start the requested mode"""
+    args = _parse_args(sys.argv[1:])
 
     # Set debug logging if requested
     if args.debug:
@@ -122,22 +142,28 @@ def main():
             logger.error("Tests failed!")
             sys.exit(1)
 
-    # Test connection before starting UI
-    if not test_azure_connection():
-        logger.error("Cannot start application - Azure OpenAI connection failed")
-        sys.exit(1)
+    # The connection is not probed here (only under --test); the first search
+    # reports any Azure problem in the UI. The shared async client is not
+    # warmed up either: these UIs run each search on a new event loop.
 
     try:
         if args.simulator:
             logger.info("Starting Touch Bar Simulator...")
+            from app.touch_bar_ui import TouchBarSimulator
+
             simulator = TouchBarSimulator()
             simulator.run()
         elif args.button:
             logger.info("Starting Touch Bar Button...")
+            from app.touch_bar_button import TouchBarButton
+
             touch_bar_button = TouchBarButton()
             touch_bar_button.run()
         elif args.touchbar:
             logger.info("Starting Real Touch Bar Integration...")
+            from AppKit import NSApplication, NSApplicationActivationPolicyAccessory
+            from app.touchbar_fixed import FixedTouchBarIntegration
+
             touch_bar = FixedTouchBarIntegration.alloc().init()
             touch_bar.setup_touch_bar()
             app = NSApplication.sharedApplication()
@@ -145,6 +171,8 @@ def main():
             app.run()
         else:
             logger.info("Starting Touch Bar Coding Assistant...")
+            from app.touch_bar_ui import TouchBarUI
+
             ui = TouchBarUI()
             ui.run()
 
@@ -7,29 +7,78 @@ A command-line version for testing and demonstration without GUI dependencies
 import sys
 import os
 import asyncio
+import logging
 import argparse
+import shelve
+from hashlib import blake2b
 from pathlib import Path
 
+import httpx
+
 # Add the app directory to the Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from app.config import settings
 from app.azure_service import AzureOpenAIService
+from app.semantic_cache import SemanticCache, NUMPY_AVAILABLE
 
-# Configure logging
-import logging
+logger = logging.getLogger(__name__)
+
+
+def _configure_logging():
+    """Configure root logging; called from main() so importing stays side-effect free"""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
 
-logging.basicConfig(
-    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Maximum number of demo questions sent to Azure OpenAI at the same time
+DEMO_CONCURRENCY = 4
+
+# Environment variables that must be set (and non-empty)
+_REQUIRED_ENV = frozenset(
+    {"AZURE_OPENAI_API_KEY", "AZURE_OPENAI_ENDPOINT", "AZURE_OPENAI_DEPLOYMENT_NAME"}
 )
-logger = logging.getLogger(__name__)
+
+# On-disk cache of answers keyed by normalized question
+CACHE_PATH = Path.home() / ".tbca_cache"
+
+# Text for --info; filled from the settings in one format_map call
+_INFO_TEMPLATE = """
+📋 Touch Bar Coding Assistant - Information
+==================================================
+📐 Touch Bar Dimensions: {TOUCH_BAR_WIDTH}x{TOUCH_BAR_HEIGHT}
+📏 Max Answer Length: {MAX_ANSWER_LENGTH} characters
+🎨 Background Color: {BACKGROUND_COLOR}
+🎨 Text Color: {TEXT_COLOR}
+🎨 Accent Color: {ACCENT_COLOR}
+🔤 Font Size: {FONT_SIZE}
+⏱️  Search Timeout: {SEARCH_TIMEOUT} seconds
+🧠 Max Tokens: {MAX_TOKENS}
+🌡️  Temperature: {TEMPERATURE}
+
+🎬 Usage Scenarios:
+  📚 During Coding Interviews:
+     - Quick algorithm complexity lookup
+     - Data structure explanations
+     - Problem-solving approach hints
+     - Code optimization tips
+
+  💻 During Development:
+     - Algorithm reference
+     - Best practices reminder
+     - Performance optimization tips
+     - Code review assistance
+"""
 
 
 class TouchBarCLI:
     """CLI version of Touch Bar Coding Assistant"""
 
-    def __init__(self):
-        self.sample_questions = [
+    SAMPLE_QUESTIONS = tuple(
+        sys.intern(q)
+        for q in (
             "What is the time complexity of binary search?",
             "How to implement a hash table?",
             "Explain dynamic programming",
@@ -40,27 +89,135 @@ class TouchBarCLI:
             "How to reverse a linked list?",
             "What is memoization?",
             "Explain the sliding window technique",
-        ]
+        )
+    )
 
-    async def get_answer(self, question: str) -> str:
-        """Get answer for a coding question"""
-        try:
-            print(f"\n🔍 Question: {question}")
-            print("-" * 60)
+    def __init__(self, use_cache: bool = True):
+        self.cache = shelve.open(str(CACHE_PATH)) if use_cache else None
+        self.semantic_cache = (
+            SemanticCache(threshold=settings.SEMANTIC_CACHE_THRESHOLD)
+            if use_cache and NUMPY_AVAILABLE
+            else None
+        )
+        self._http = None
 
+    async def __aenter__(self):
+        """Open one pooled HTTP client shared by every Azure call"""
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=30,
+        )
+        AzureOpenAIService.warmup(http_client=self._http)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        """Close the shared Azure client and its connections"""
+        await AzureOpenAIService.aclose()
+        await self._http.aclose()
+        self._http = None
+        if self.cache is not None:
+            self.cache.close()
+            self.cache = None
+
+    async def _lookup_cached(self, question: str) -> tuple:
+        """
+        Look a question up in the exact and semantic caches
+
+        Returns (answer, key, embedding); answer is None on a miss, and key and
+        embedding are what _store_answer needs to cache the eventual answer.
+        """
+        key = None
+        if self.cache is not None:
+            key = blake2b(question.strip().lower().encode()).hexdigest()
+            if key in self.cache:
+                return self.cache[key], key, None
+
+        # Near-duplicate questions are answered from the semantic cache. It
+        # starts empty in every process, so don't pay for an embedding until
+        # there is something to compare against.
+        embedding = None
+        if self.semantic_cache is not None and len(self.semantic_cache):
+            try:
+                embedding = await AzureOpenAIService.embed(question)
+                answer = self.semantic_cache.get(embedding)
+            except Exception as e:
+                logger.warning("Skipping semantic cache: %s", e)
+            else:
+                if answer is not None:
+                    return answer, key, embedding
+
+        return None, key, embedding
+
+    async def _store_answer(self, question: str, key, embedding, answer: str):
+        """Cache a fresh answer; the service reports failures as text"""
+        if not answer or answer.startswith(("Error:", "Unable to")):
+            return
+        if key is not None:
+            self.cache[key] = answer
+        if self.semantic_cache is not None:
+            try:
+                if embedding is None:
+                    embedding = await AzureOpenAIService.embed(question)
+                self.semantic_cache.put(embedding, answer)
+            except Exception as e:
+                logger.warning("Not adding answer to semantic cache: %s", e)
+
+    async def fetch_answer(self, question: str) -> tuple:
+        """Fetch the answer for a coding question without printing it"""
+        answer, key, embedding = await self._lookup_cached(question)
+        if answer is not None:
+            return question, answer
+
+        try:
             answer = await AzureOpenAIService.get_coding_answer(question)
-            print(f"💡 Answer: {answer}")
-            print(f"📏 Length: {len(answer)} characters")
+        except Exception as e:
+            return question, f"❌ Error: {str(e)}"
+
+        await self._store_answer(question, key, embedding, answer)
+        return question, answer
+
+    def print_answer(self, question: str, answer: str):
+        """Print a question and its answer"""
+        print(f"\n🔍 Question: {question}")
+        print("-" * 60)
+        print(f"💡 Answer: {answer}")
+        self._print_length(answer)
+
+    def _print_length(self, answer: str):
+        """Print the answer length and whether it was cut for the Touch Bar"""
+        print(f"📏 Length: {len(answer)} characters")
 
-            if len(answer) > settings.MAX_ANSWER_LENGTH:
-                print("⚠️  Answer was truncated for Touch Bar display")
+        if len(answer) > settings.MAX_ANSWER_LENGTH:
+            print("⚠️  Answer was truncated for Touch Bar display")
 
+    async def get_answer(self, question: str) -> str:
+        """Get answer for a coding question, printing it as it streams in"""
+        answer, key, embedding = await self._lookup_cached(question)
+        if answer is not None:
+            self.print_answer(question, answer)
             return answer
 
+        print(f"\n🔍 Question: {question}")
+        print("-" * 60)
+        sys.stdout.write("💡 Answer: ")
+
+        pieces = []
+        try:
+            async for piece in AzureOpenAIService.stream_coding_answer(question):
+                sys.stdout.write(piece)
+                sys.stdout.flush()
+                pieces.append(piece)
         except Exception as e:
+            print()
             error_msg = f"❌ Error: {str(e)}"
             print(error_msg)
             return error_msg
+        print()
+
+        answer = "".join(pieces)
+        self._print_length(answer)
+        await self._store_answer(question, key, embedding, answer)
+        return answer
 
     async def interactive_mode(self):
         """Run in interactive mode"""
@@ -80,7 +237,7 @@ class TouchBarCLI:
 
                 if question.lower() == "sample":
                     print("\n📝 Sample Questions:")
-                    for i, q in enumerate(self.sample_questions, 1):
+                    for i, q in enumerate(self.SAMPLE_QUESTIONS, 1):
                         print(f"  {i}. {q}")
                     continue
 
@@ -100,66 +257,57 @@ class TouchBarCLI:
             except Exception as e:
                 print(f"❌ Unexpected error: {str(e)}")
 
-    async def run_demo(self, num_questions: int = 3):
+    async def run_demo(self, num_questions: int = 3, batched: bool = False):
         """Run a demo with sample questions"""
         print(f"\n🎯 Running demo with {num_questions} questions...")
         print("=" * 80)
 
-        for i, question in enumerate(self.sample_questions[:num_questions], 1):
-            print(f"\n📝 Question {i}/{num_questions}")
-            await self.get_answer(question)
+        if batched:
+            # One request for all questions: fewer calls, but waits for the lot
+            questions = self.SAMPLE_QUESTIONS[:num_questions]
+            answers = await AzureOpenAIService.get_coding_answers_batch(list(questions))
+            for i, (question, answer) in enumerate(zip(questions, answers), 1):
+                print(f"\n📝 Question {i}/{num_questions}")
+                self.print_answer(question, answer)
+
+            print("\n🎉 Demo completed!")
+            return
+
+        # Ask all questions at once, capped to stay within Azure rate limits
+        semaphore = asyncio.Semaphore(min(num_questions, DEMO_CONCURRENCY))
+
+        async def limited(question):
+            async with semaphore:
+                return await self.fetch_answer(question)
+
+        tasks = [
+            asyncio.create_task(limited(q))
+            for q in self.SAMPLE_QUESTIONS[:num_questions]
+        ]
 
-            # Add a small delay between questions
-            await asyncio.sleep(1)
+        # Print answers in the order they arrive
+        for i, task in enumerate(asyncio.as_completed(tasks), 1):
+            question, answer = await task
+            print(f"\n📝 Question {i}/{num_questions}")
+            self.print_answer(question, answer)
 
         print("\n🎉 Demo completed!")
 
     def show_info(self):
         """Show application information"""
-        print("\n📋 Touch Bar Coding Assistant - Information")
-        print("=" * 50)
-        print(
-            f"📐 Touch Bar Dimensions: {settings.TOUCH_BAR_WIDTH}x{settings.TOUCH_BAR_HEIGHT}"
-        )
-        print(f"📏 Max Answer Length: {settings.MAX_ANSWER_LENGTH} characters")
-        print(f"🎨 Background Color: {settings.BACKGROUND_COLOR}")
-        print(f"🎨 Text Color: {settings.TEXT_COLOR}")
-        print(f"🎨 Accent Color: {settings.ACCENT_COLOR}")
-        print(f"🔤 Font Size: {settings.FONT_SIZE}")
-        print(f"⏱️  Search Timeout: {settings.SEARCH_TIMEOUT} seconds")
-        print(f"🧠 Max Tokens: {settings.MAX_TOKENS}")
-        print(f"🌡️  Temperature: {settings.TEMPERATURE}")
-
-        print("\n🎬 Usage Scenarios:")
-        print("  📚 During Coding Interviews:")
-        print("     - Quick algorithm complexity lookup")
-        print("     - Data structure explanations")
-        print("     - Problem-solving approach hints")
-        print("     - Code optimization tips")
-
-        print("\n  💻 During Development:")
-        print("     - Algorithm reference")
-        print("     - Best practices reminder")
-        print("     - Performance optimization tips")
-        print("     - Code review assistance")
+        sys.stdout.write(_INFO_TEMPLATE.format_map(settings.model_dump()))
+        sys.stdout.flush()
 
 
 def check_environment():
     """Check if required environment variables are set"""
-    required_vars = [
-        "AZURE_OPENAI_API_KEY",
-        "AZURE_OPENAI_ENDPOINT",
-        "AZURE_OPENAI_DEPLOYMENT_NAME",
-    ]
-
-    missing_vars = []
-    for var in required_vars:
-        if not os.getenv(var):
-            missing_vars.append(var)
+    # Empty values count as missing, so this can't be a plain
+    # _REQUIRED_ENV - os.environ.keys()
+    missing_vars = sorted(v for v in _REQUIRED_ENV if not os.environ.get(v))
 
     if missing_vars:
         logger.error(
-            f"Missing required environment variables: {', '.join(missing_vars)}"
+            "Missing required environment variables: %s", ", ".join(missing_vars)
         )
         logger.error("Please set these variables in your .env file or environment")
         return False
@@ -171,12 +319,18 @@ async def test_azure_connection():
     """Test the Azure OpenAI connection"""
     try:
         logger.info("Testing Azure OpenAI connection...")
-        # This will test the connection during initialization
-        AzureOpenAIService.get_llm()
-        logger.info("✅ Azure OpenAI connection successful")
+        # This will test the connection during initialization. get_llm() is
+        # synchronous and may sleep between retries, so keep it off the loop
+        await asyncio.get_running_loop().run_in_executor(
+            None, AzureOpenAIService.get_llm
+        )
+        logger.info(
+            "✅ Azure OpenAI connection successful: %s",
+            settings.AZURE_OPENAI_ENDPOINT,
+        )
         return True
     except Exception as e:
-        logger.error(f"❌ Azure OpenAI connection failed: {str(e)}")
+        logger.error("❌ Azure OpenAI connection failed: %s", e)
         return False
 
 
@@ -191,13 +345,25 @@ async def main():
     parser.add_argument(
         "--demo", action="store_true", help="Run a quick demo with sample questions"
     )
+    parser.add_argument(
+        "--batched",
+        action="store_true",
+        help="With --demo, ask all sample questions in a single request",
+    )
     parser.add_argument("--question", type=str, help="Ask a specific question")
     parser.add_argument(
         "--info", action="store_true", help="Show application information"
     )
+    parser.add_argument(
+        "--no-cache", action="store_true", help="Don't read or write the answer cache"
+    )
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
 
     args = parser.parse_args()
+    if args.batched and not args.demo:
+        parser.error("--batched can only be used with --demo")
+
+    _configure_logging()
 
     # Set debug logging if requested
     if args.debug:
@@ -217,27 +383,27 @@ async def main():
             logger.error("Tests failed!")
             sys.exit(1)
 
-    # Test connection before starting
+    # Test connection before starting; questions then go through the pooled
+    # async client that TouchBarCLI sets up
     if not await test_azure_connection():
         logger.error("Cannot start application - Azure OpenAI connection failed")
         sys.exit(1)
 
-    cli = TouchBarCLI()
-
     try:
-        if args.info:
-            cli.show_info()
-        elif args.demo:
-            await cli.run_demo()
-        elif args.question:
-            await cli.get_answer(args.question)
-        else:
-            await cli.interactive_mode()
+        async with TouchBarCLI(use_cache=not args.no_cache) as cli:
+            if args.info:
+                cli.show_info()
+            elif args.demo:
+                await cli.run_demo(batched=args.batched)
+            elif args.question:
+                await cli.get_answer(args.question)
+            else:
+                await cli.interactive_mode()
 
     except KeyboardInterrupt:
         logger.info("Application interrupted by user")
     except Exception as e:
-        logger.error(f"Application error: {str(e)}", exc_info=True)
+        logger.error("Application error: %s", e, exc_info=True)
         sys.exit(1)
 
 
@@ -4,6 +4,7 @@ Test runner for Touch Bar Coding Assistant
 Runs all tests and generates coverage reports
 """
 
+import shutil
 import subprocess
 import sys
 import os
@@ -40,40 +41,35 @@ def run_command(command, description):
 
 def install_test_dependencies():
     """Install test dependencies"""
-    dependencies = ["pytest", "pytest-asyncio", "pytest-cov", "pytest-mock"]
-
-    for dep in dependencies:
-        command = f"pip install {dep}"
-        if not run_command(command, f"Installing {dep}"):
-            return False
-    return True
-
-
-def run_unit_tests():
-    """Run unit tests"""
-    command = "python -m pytest tests/ -v --tb=short"
-    return run_command(command, "Unit Tests")
+    dependencies = [
+        "pytest",
+        "pytest-asyncio",
+        "pytest-cov",
+        "pytest-mock",
+        "pytest-xdist",
+    ]
+
+    # One installer run resolves everything together; prefer uv when present,
+    # and always target this interpreter rather than whatever pip is on PATH
+    if shutil.which("uv"):
+        command = f'uv pip install --python "{sys.executable}" -q'
+    else:
+        command = (
+            f'"{sys.executable}" -m pip install '
+            "--no-input --disable-pip-version-check -q"
+        )
+    command = f"{command} {' '.join(dependencies)}"
+    return run_command(command, "Installing test dependencies")
 
 
-def run_coverage_tests():
-    """Run tests with coverage"""
+def run_all_tests():
+    """Run the whole suite once, in parallel, with coverage"""
     command = (
-        "python -m pytest tests/ --cov=app --cov-report=html --cov-report=term-missing"
+        "python -m pytest tests/ -v --tb=short "
+        "--cov=app --cov-context=test --cov-report=html --cov-report=term-missing "
+        "-n auto -p no:cacheprovider"
     )
-    return run_command(command, "Coverage Tests")
-
-
-def run_specific_tests():
-    """Run specific test categories"""
-    test_files = ["tests/test_azure_service.py", "tests/test_touch_bar_ui.py"]
-
-    all_passed = True
-    for test_file in test_files:
-        command = f"python -m pytest {test_file} -v"
-        if not run_command(command, f"Running {test_file}"):
-            all_passed = False
-
-    return all_passed
+    return run_command(command, "Unit + Coverage Tests")
 
 
 def run_integration_tests():
@@ -109,14 +105,8 @@ def main():
 
     print("\n🔍 Running test suite...")
 
-    # Unit tests
-    test_results.append(("Unit Tests", run_unit_tests()))
-
-    # Specific test files
-    test_results.append(("Specific Tests", run_specific_tests()))
-
-    # Coverage tests
-    test_results.append(("Coverage Tests", run_coverage_tests()))
+    # Unit tests with coverage (one parallel pass over every test file)
+    test_results.append(("Unit + Coverage", run_all_tests()))
 
     # Code quality check
     test_results.append(("Code Quality", check_code_quality()))
@@ -46,8 +46,9 @@ setup(
     extras_require={
         "dev": [
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "pytest-mock>=3.10.0",
             "flake8>=5.0.0",
             "black>=22.0.0",
@@ -55,8 +56,9 @@ setup(
         ],
         "test": [
             "pytest>=7.0.0",
-            "pytest-asyncio>=0.21.0",
+            "pytest-asyncio>=0.24.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "pytest-mock>=3.10.0",
         ],
     },
@@ -2,7 +2,7 @@ import pytest
 import asyncio
 import os
 from unittest.mock import Mock, patch, AsyncMock
-from app.azure_service import AzureOpenAIService
+from app.azure_service import AzureOpenAIService, _ENDPOINT_RE
 from app.config import settings
 
 
@@ -44,6 +44,14 @@ class TestAzureOpenAIService:
 
             yield mock_instance
 
+    @pytest.fixture
+    def shared_client_state(self):
+        """Restore the shared async client state after each test"""
+        with patch.object(AzureOpenAIService, "_async_client", None), patch.object(
+            AzureOpenAIService, "_client_loop", None
+        ):
+            yield
+
     def test_get_llm_success(self, mock_env_vars, mock_azure_client):
         """Test successful LLM creation"""
         with patch("app.azure_service.AzureChatOpenAI") as mock_langchain:
@@ -164,6 +172,165 @@ class TestAzureOpenAIService:
 
             assert "Error: Unable to connect to AI service" in result
 
+    @pytest.mark.asyncio
+    async def test_get_coding_answers_batch(self, mock_env_vars):
+        """Test a numbered batched reply is split into one answer per question"""
+        with patch(
+            "app.azure_service.AzureOpenAIService.generate_completion"
+        ) as mock_gen:
+            mock_gen.return_value = "1. O(log n)\n2. Use a hash map\n3. " + "A" * 300
+
+            with patch("app.azure_service.settings") as mock_settings:
+                mock_settings.MAX_ANSWER_LENGTH = 200
+                mock_settings.MAX_TOKENS = 1000
+                mock_settings.TEMPERATURE = 0.7
+
+                result = await AzureOpenAIService.get_coding_answers_batch(
+                    ["Binary search?", "Duplicates?", "Long one?"]
+                )
+
+                assert result[:2] == ["O(log n)", "Use a hash map"]
+                assert len(result[2]) == 200 and result[2].endswith("...")
+                mock_gen.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_coding_answers_batch_fallback(self, mock_env_vars):
+        """Test a reply that doesn't split cleanly falls back to single questions"""
+        with patch(
+            "app.azure_service.AzureOpenAIService.generate_completion"
+        ) as mock_gen, patch(
+            "app.azure_service.AzureOpenAIService.get_coding_answer"
+        ) as mock_single:
+            mock_gen.return_value = "Both use O(n) time."
+            mock_single.side_effect = ["first", "second"]
+
+            result = await AzureOpenAIService.get_coding_answers_batch(["Q1", "Q2"])
+
+            assert result == ["first", "second"]
+            assert mock_single.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stream_coding_answer(self, mock_env_vars, shared_client_state):
+        """Test streamed coding answer is yielded piece by piece and truncated"""
+
+        async def fake_stream():
+            for text in ["Use a ", None, "hash map", "A" * 300]:
+                chunk = Mock()
+                chunk.choices = [Mock()]
+                chunk.choices[0].delta.content = text
+                yield chunk
+
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(return_value=fake_stream())
+        AzureOpenAIService._async_client = mock_client
+
+        with patch("app.azure_service.settings") as mock_settings:
+            mock_settings.MAX_ANSWER_LENGTH = 200
+            mock_settings.MAX_TOKENS = 1000
+            mock_settings.TEMPERATURE = 0.7
+
+            pieces = [
+                piece
+                async for piece in AzureOpenAIService.stream_coding_answer(
+                    "How to find duplicates in array?"
+                )
+            ]
+
+        assert pieces[:2] == ["Use a ", "hash map"]
+        assert len("".join(pieces)) == 200
+        assert pieces[-1].endswith("...")
+        assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
+
+    def test_warmup_creates_one_client(self, mock_env_vars, shared_client_state):
+        """Test warmup builds a single pooled client on the normalized endpoint"""
+        with patch("app.azure_service.AsyncAzureOpenAI") as mock_async, patch(
+            "app.azure_service.httpx.AsyncClient"
+        ) as mock_http:
+            first = AzureOpenAIService.warmup()
+            second = AzureOpenAIService.warmup()
+
+        assert first is second is mock_async.return_value
+        mock_async.assert_called_once()
+        kwargs = mock_async.call_args.kwargs
+        assert kwargs["azure_endpoint"] == "https://test.openai.azure.com"
+        assert kwargs["http_client"] is mock_http.return_value
+
+    @pytest.mark.asyncio
+    async def test_generate_completion_shared_client(
+        self, mock_env_vars, shared_client_state
+    ):
+        """Test completions go through the warmed-up client on its own loop"""
+        mock_response = Mock()
+        mock_response.choices = [Mock()]
+        mock_response.choices[0].message.content = "Pooled response"
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+        AzureOpenAIService._async_client = mock_client
+
+        with patch("app.azure_service.AzureOpenAIService.get_llm") as mock_get_llm:
+            messages = [{"role": "user", "content": "Test question"}]
+            result = await AzureOpenAIService.generate_completion(messages)
+
+        assert result == "Pooled response"
+        assert AzureOpenAIService._client_loop is asyncio.get_running_loop()
+        mock_get_llm.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_generate_completion_other_loop(
+        self, mock_env_vars, shared_client_state
+    ):
+        """Test a client bound to another loop is skipped in favour of get_llm"""
+        mock_client = Mock()
+        mock_client.chat.completions.create = AsyncMock()
+        AzureOpenAIService._async_client = mock_client
+        AzureOpenAIService._client_loop = asyncio.new_event_loop()
+
+        try:
+            with patch("app.azure_service.AzureOpenAIService.get_llm") as mock_get_llm:
+                mock_get_llm.return_value.invoke.return_value = Mock(
+                    content="Per-loop response"
+                )
+                messages = [{"role": "user", "content": "Test question"}]
+                result = await AzureOpenAIService.generate_completion(messages)
+        finally:
+            AzureOpenAIService._client_loop.close()
+
+        assert result == "Per-loop response"
+        mock_client.chat.completions.create.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_aclose(self, shared_client_state):
+        """Test aclose closes the shared client and forgets its loop"""
+        mock_client = Mock()
+        mock_client.close = AsyncMock()
+        AzureOpenAIService._async_client = mock_client
+        AzureOpenAIService._client_loop = asyncio.get_running_loop()
+
+        await AzureOpenAIService.aclose()
+
+        mock_client.close.assert_awaited_once()
+        assert AzureOpenAIService._async_client is None
+        assert AzureOpenAIService._client_loop is None
+
+    @pytest.mark.asyncio
+    async def test_embed(self, mock_env_vars, shared_client_state):
+        """Test embed returns the embedding from the shared client"""
+        mock_client = Mock()
+        mock_client.embeddings.create = AsyncMock(
+            return_value=Mock(data=[Mock(embedding=[0.1, 0.2])])
+        )
+        AzureOpenAIService._async_client = mock_client
+
+        with patch("app.azure_service.settings") as mock_settings:
+            mock_settings.AZURE_OPENAI_EMBEDDING_DEPLOYMENT = "test_embedding"
+
+            result = await AzureOpenAIService.embed("binary search")
+
+        assert result == [0.1, 0.2]
+        mock_client.embeddings.create.assert_awaited_once_with(
+            model="test_embedding", input="binary search"
+        )
+
     def test_endpoint_parsing(self, mock_env_vars):
         """Test Azure endpoint URL parsing"""
         test_cases = [
@@ -186,6 +353,8 @@ class TestAzureOpenAIService:
                         except:
                             pass  # We're just testing the parsing, not the full connection
 
+            assert _ENDPOINT_RE.match(input_endpoint).group(1) == expected
+
 
 class TestAzureServiceIntegration:
     """Integration tests for Azure service"""
@@ -0,0 +1,197 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, call, patch
+
+import main_cli
+from main_cli import DEMO_CONCURRENCY, TouchBarCLI
+
+
+class TestTouchBarCLIDemo:
+    """Test cases for the CLI demo modes"""
+
+    @pytest.fixture
+    def cli(self):
+        """Create a TouchBarCLI without any answer cache"""
+        return TouchBarCLI(use_cache=False)
+
+    @pytest.mark.asyncio
+    async def test_run_demo_caps_concurrency(self, cli):
+        """Test no more than DEMO_CONCURRENCY questions are in flight at once"""
+        in_flight = 0
+        peak = 0
+
+        async def fake_answer(question):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return f"Answer to {question}"
+
+        num_questions = DEMO_CONCURRENCY * 2
+        with patch(
+            "main_cli.AzureOpenAIService.get_coding_answer",
+            new_callable=AsyncMock,
+            side_effect=fake_answer,
+        ) as mock_get_answer, patch.object(cli, "print_answer") as mock_print:
+            with patch("builtins.print"):
+                await cli.run_demo(num_questions)
+
+        assert peak == DEMO_CONCURRENCY
+        assert mock_get_answer.await_count == num_questions
+        assert mock_print.call_count == num_questions
+
+    @pytest.mark.asyncio
+    async def test_run_demo_batched_keeps_order(self, cli):
+        """Test batched answers are printed against their own questions"""
+        questions = TouchBarCLI.SAMPLE_QUESTIONS[:3]
+
+        with patch(
+            "main_cli.AzureOpenAIService.get_coding_answers_batch",
+            new_callable=AsyncMock,
+            return_value=["first", "second", "third"],
+        ) as mock_batch, patch.object(cli, "print_answer") as mock_print:
+            with patch("builtins.print"):
+                await cli.run_demo(3, batched=True)
+
+        mock_batch.assert_awaited_once_with(list(questions))
+        assert mock_print.call_args_list == [
+            call(questions[0], "first"),
+            call(questions[1], "second"),
+            call(questions[2], "third"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batched_requires_demo(self):
+        """Test --batched without --demo is rejected"""
+        with patch("sys.argv", ["main_cli.py", "--batched"]):
+            with pytest.raises(SystemExit) as exc_info:
+                await main_cli.main()
+
+        assert exc_info.value.code == 2
+
+
+class TestTouchBarCLICache:
+    """Test cases for the CLI answer caches"""
+
+    @pytest.fixture
+    def cli(self, tmp_path):
+        """Create a TouchBarCLI with a shelve cache under tmp_path"""
+        with patch("main_cli.CACHE_PATH", tmp_path / "answers"), patch(
+            "main_cli.NUMPY_AVAILABLE", False
+        ):
+            cli = TouchBarCLI(use_cache=True)
+        yield cli
+        cli.cache.close()
+
+    @pytest.mark.asyncio
+    async def test_fetch_answer_cache_hit(self, cli):
+        """Test a repeated question (up to case and spacing) is answered from disk"""
+        with patch(
+            "main_cli.AzureOpenAIService.get_coding_answer",
+            new_callable=AsyncMock,
+            return_value="Use a hash map",
+        ) as mock_get_answer:
+            first = await cli.fetch_answer("How to find duplicates?")
+            second = await cli.fetch_answer("  how to find DUPLICATES?  ")
+
+        assert first == ("How to find duplicates?", "Use a hash map")
+        assert second[1] == "Use a hash map"
+        mock_get_answer.assert_awaited_once_with("How to find duplicates?")
+
+    @pytest.mark.asyncio
+    async def test_fetch_answer_cache_miss(self, cli):
+        """Test different questions each go to the service"""
+        with patch(
+            "main_cli.AzureOpenAIService.get_coding_answer",
+            new_callable=AsyncMock,
+            side_effect=["O(log n)", "Use a hash map"],
+        ) as mock_get_answer:
+            await cli.fetch_answer("Binary search?")
+            await cli.fetch_answer("Duplicates?")
+
+        assert mock_get_answer.await_count == 2
+        assert len(cli.cache) == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_answers_not_cached(self, cli):
+        """Test error answers are returned but never stored"""
+        with patch(
+            "main_cli.AzureOpenAIService.get_coding_answer",
+            new_callable=AsyncMock,
+            side_effect=[
+                "Error: Unable to connect to AI service.",
+                "Unable to generate answer. Please try again.",
+                "O(log n)",
+            ],
+        ) as mock_get_answer:
+            results = [(await cli.fetch_answer("Binary search?"))[1] for _ in range(3)]
+
+        assert results[-1] == "O(log n)"
+        assert mock_get_answer.await_count == 3
+        assert list(cli.cache.values()) == ["O(log n)"]
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_hit(self, cli):
+        """Test a near-duplicate question is answered from the semantic cache"""
+        cli.semantic_cache = MagicMock()
+        cli.semantic_cache.__len__.return_value = 1
+        cli.semantic_cache.get.return_value = "Use a hash map"
+
+        with patch(
+            "main_cli.AzureOpenAIService.embed",
+            new_callable=AsyncMock,
+            return_value=[0.1, 0.2],
+        ), patch(
+            "main_cli.AzureOpenAIService.get_coding_answer", new_callable=AsyncMock
+        ) as mock_get_answer:
+            _, answer = await cli.fetch_answer("Find repeated elements?")
+
+        assert answer == "Use a hash map"
+        cli.semantic_cache.get.assert_called_once_with([0.1, 0.2])
+        mock_get_answer.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_semantic_cache_embeds_only_to_store(self, cli):
+        """Test an empty semantic cache is not searched; the answer is stored"""
+        cli.semantic_cache = MagicMock()
+        cli.semantic_cache.__len__.return_value = 0
+
+        with patch(
+            "main_cli.AzureOpenAIService.embed",
+            new_callable=AsyncMock,
+            return_value=[0.1, 0.2],
+        ) as mock_embed, patch(
+            "main_cli.AzureOpenAIService.get_coding_answer",
+            new_callable=AsyncMock,
+            return_value="O(log n)",
+        ):
+            await cli.fetch_answer("Binary search?")
+
+        cli.semantic_cache.get.assert_not_called()
+        mock_embed.assert_awaited_once_with("Binary search?")
+        cli.semantic_cache.put.assert_called_once_with([0.1, 0.2], "O(log n)")
+
+    @pytest.mark.asyncio
+    async def test_semantic_cache_errors_are_skipped(self, cli):
+        """Test a failing semantic lookup falls back to the service"""
+        cli.semantic_cache = MagicMock()
+        cli.semantic_cache.__len__.return_value = 1
+        cli.semantic_cache.get.side_effect = ValueError("shapes not aligned")
+
+        with patch(
+            "main_cli.AzureOpenAIService.embed",
+            new_callable=AsyncMock,
+            return_value=[0.1, 0.2],
+        ), patch(
+            "main_cli.AzureOpenAIService.get_coding_answer",
+            new_callable=AsyncMock,
+            return_value="O(log n)",
+        ):
+            _, answer = await cli.fetch_answer("Binary search?")
+
+        assert answer == "O(log n)"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__])
@@ -0,0 +1,48 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from app.semantic_cache import SemanticCache
+
+
+class TestSemanticCache:
+    """Test cases for SemanticCache"""
+
+    def test_similar_question_hits(self):
+        """Test a near-identical embedding returns the cached answer"""
+        cache = SemanticCache(dim=3, capacity=4, threshold=0.9)
+        cache.put([1.0, 0.0, 0.0], "O(log n)")
+
+        assert cache.get([0.99, 0.05, 0.0]) == "O(log n)"
+
+    def test_dissimilar_question_misses(self):
+        """Test an unrelated embedding is not a hit"""
+        cache = SemanticCache(dim=3, capacity=4, threshold=0.9)
+        cache.put([1.0, 0.0, 0.0], "O(log n)")
+
+        assert cache.get([0.0, 1.0, 0.0]) is None
+        assert SemanticCache(dim=3).get([1.0, 0.0, 0.0]) is None
+
+    def test_evicts_least_recently_used(self):
+        """Test the least recently used entry is replaced when full"""
+        cache = SemanticCache(dim=3, capacity=2, threshold=0.9)
+        cache.put([1.0, 0.0, 0.0], "first")
+        cache.put([0.0, 1.0, 0.0], "second")
+        cache.get([1.0, 0.0, 0.0])  # "first" is now the most recent
+
+        cache.put([0.0, 0.0, 1.0], "third")
+
+        assert len(cache) == 2
+        assert cache.get([1.0, 0.0, 0.0]) == "first"
+        assert cache.get([0.0, 1.0, 0.0]) is None
+        assert cache.get([0.0, 0.0, 1.0]) == "third"
+
+    def test_dimension_from_first_embedding(self):
+        """Test the size comes from the first embedding; other sizes are skipped"""
+        cache = SemanticCache(capacity=4, threshold=0.9)
+        cache.put([1.0, 0.0, 0.0, 0.0], "O(log n)")
+        cache.put([1.0, 0.0], "wrong size")
+
+        assert len(cache) == 1
+        assert cache.get([1.0, 0.0]) is None
+        assert cache.get([1.0, 0.0, 0.0, 0.0]) == "O(log n)"
@@ -1,18 +1,53 @@
+import contextlib
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, patch, AsyncMock, call, create_autospec
 from app.config import settings
 
-# Try to import tkinter, skip tests if not available
-try:
-    import tkinter as tk
-
-    TKINTER_AVAILABLE = True
-except ImportError:
-    TKINTER_AVAILABLE = False
-
-# Only import UI classes if tkinter is available
-if TKINTER_AVAILABLE:
-    from app.touch_bar_ui import TouchBarUI, TouchBarSimulator
+# Skip the whole module when tkinter is not available
+tk = pytest.importorskip("tkinter")
+
+from tkinter import ttk
+from app.touch_bar_ui import TouchBarUI, TouchBarSimulator
+
+# Widget classes the mocked widgets are specced against, so a misspelt
+# widget method fails the test instead of silently passing
+WIDGET_SPECS = {
+    "search_entry": ttk.Entry,
+    "answer_label": ttk.Label,
+    "status_label": ttk.Label,
+    "search_button": ttk.Button,
+}
+
+_W, _H = settings.TOUCH_BAR_WIDTH, settings.TOUCH_BAR_HEIGHT
+_BG, _FG = settings.BACKGROUND_COLOR, settings.TEXT_COLOR
+EXPECTED_GEOMETRY_PREFIX = f"{_W}x{_H}"
+
+
+@pytest.fixture(scope="class")
+def mock_tkinter():
+    """Mock tkinter components once per test class"""
+    with contextlib.ExitStack() as stack:
+        mock_tk = stack.enter_context(patch("app.touch_bar_ui.tk.Tk"))
+        mock_ttk = stack.enter_context(patch("app.touch_bar_ui.ttk"))
+        mock_messagebox = stack.enter_context(patch("app.touch_bar_ui.messagebox"))
+        mock_root = Mock()
+        mock_tk.return_value = mock_root
+        mock_root.winfo_screenheight.return_value = 1080
+
+        yield {
+            "tk": mock_tk,
+            "ttk": mock_ttk,
+            "messagebox": mock_messagebox,
+            "root": mock_root,
+        }
+
+
+@pytest.fixture(scope="class")
+def created_ui(mock_tkinter):
+    """Create the UI once for the tests that only exercise its handlers"""
+    ui = TouchBarUI()
+    ui.create_ui()
+    return ui
 
 
 class TestTouchBarUI:
@@ -21,26 +56,40 @@ class TestTouchBarUI:
     @pytest.fixture
     def ui(self):
         """Create a TouchBarUI instance for testing"""
-        if not TKINTER_AVAILABLE:
-            pytest.skip("Tkinter not available")
         return TouchBarUI()
 
+    @pytest.fixture(autouse=True)
+    def reset_tkinter_mocks(self, mock_tkinter):
+        """Clear recorded calls so each test starts from a clean mock"""
+        for mock in mock_tkinter.values():
+            mock.reset_mock()
+
+    @pytest.fixture(autouse=True)
+    def no_threads(self, monkeypatch):
+        """Replace threading.Thread with a stub that records but never runs"""
+
+        class StubThread:
+            instances = []
+
+            def __init__(self, target=None, args=(), **kwargs):
+                self.target = target
+                self.args = args
+                self.started = False
+                StubThread.instances.append(self)
+
+            def start(self):
+                self.started = True
+
+        monkeypatch.setattr("threading.Thread", StubThread)
+        return StubThread
+
     @pytest.fixture
-    def mock_tkinter(self):
-        """Mock tkinter components"""
-        with patch("app.touch_bar_ui.tk.Tk") as mock_tk:
-            with patch("app.touch_bar_ui.ttk") as mock_ttk:
-                with patch("app.touch_bar_ui.messagebox") as mock_messagebox:
-                    mock_root = Mock()
-                    mock_tk.return_value = mock_root
-                    mock_root.winfo_screenheight.return_value = 1080
-
-                    yield {
-                        "tk": mock_tk,
-                        "ttk": mock_ttk,
-                        "messagebox": mock_messagebox,
-                        "root": mock_root,
-                    }
+    def prepared_ui(self, created_ui):
+        """Return the shared UI with fresh specced mocks for its widgets"""
+        for name, widget_cls in WIDGET_SPECS.items():
+            setattr(created_ui, name, create_autospec(widget_cls, instance=True))
+        created_ui.is_searching = False
+        return created_ui
 
     def test_ui_initialization(self, ui):
         """Test UI initialization"""
@@ -57,101 +106,81 @@ class TestTouchBarUI:
         mock_tkinter["tk"].assert_called_once()
         mock_tkinter["root"].title.assert_called_with("Touch Bar Coding Assistant")
 
-    def test_on_search_empty_question(self, ui, mock_tkinter):
-        """Test search with empty question"""
-        ui.create_ui()
-        ui.search_entry = Mock()
-        ui.search_entry.get.return_value = ""
-
-        ui._on_search()
-
-        mock_tkinter["messagebox"].showwarning.assert_called_once()
-
-    def test_on_search_valid_question(self, ui, mock_tkinter):
-        """Test search with valid question"""
-        ui.create_ui()
-        ui.search_entry = Mock()
-        ui.search_entry.get.return_value = "What is binary search?"
-        ui.search_button = Mock()
-        ui.status_label = Mock()
-        ui.answer_label = Mock()
-
-        with patch.object(ui, "_start_search") as mock_start:
-            ui._on_search()
-            mock_start.assert_called_once_with("What is binary search?")
+    @pytest.mark.parametrize(
+        "question, warns, starts",
+        [("", True, False), ("What is binary search?", False, True)],
+    )
+    def test_on_search(
+        self, prepared_ui, mock_tkinter, no_threads, question, warns, starts
+    ):
+        """Test the search flow for empty and valid questions"""
+        prepared_ui.search_entry.get.return_value = question
+
+        prepared_ui._on_search()
+
+        assert mock_tkinter["messagebox"].showwarning.called is warns
+        assert prepared_ui.is_searching is starts
+        if starts:
+            prepared_ui.search_button.config.assert_called_with(state="disabled")
+            prepared_ui.status_label.config.assert_called_with(text="Searching...")
+            prepared_ui.answer_label.config.assert_called_with(
+                text="Generating answer..."
+            )
+            (thread,) = no_threads.instances
+            assert thread.target == prepared_ui._run_search and thread.started
+            assert thread.args == (question,)
+        else:
+            assert no_threads.instances == []
 
-    def test_on_clear(self, ui, mock_tkinter):
+    def test_on_clear(self, prepared_ui):
         """Test clear functionality"""
-        ui.create_ui()
-        ui.search_entry = Mock()
-        ui.answer_label = Mock()
-        ui.status_label = Mock()
-
-        ui._on_clear()
-
-        ui.search_entry.delete.assert_called_once_with(0, tk.END)
-        ui.answer_label.config.assert_called_once()
-        ui.status_label.config.assert_called_once_with(text="Ready")
-        ui.search_entry.focus.assert_called_once()
-
-    def test_start_search(self, ui, mock_tkinter):
-        """Test search start process"""
-        ui.create_ui()
-        ui.search_button = Mock()
-        ui.status_label = Mock()
-        ui.answer_label = Mock()
-
-        with patch("threading.Thread") as mock_thread:
-            ui._start_search("Test question")
-
-            assert ui.is_searching is True
-            ui.search_button.config.assert_called_with(state="disabled")
-            ui.status_label.config.assert_called_with(text="Searching...")
-            ui.answer_label.config.assert_called_with(text="Generating answer...")
-            mock_thread.assert_called_once()
-
-    def test_update_answer(self, ui, mock_tkinter):
+        prepared_ui._on_clear()
+
+        assert (
+            prepared_ui.search_entry.method_calls,
+            prepared_ui.answer_label.method_calls,
+            prepared_ui.status_label.method_calls,
+        ) == (
+            [call.delete(0, tk.END), call.focus()],
+            [call.config(text="Ask a coding interview question...")],
+            [call.config(text="Ready")],
+        )
+
+    def test_update_answer(self, prepared_ui):
         """Test answer update"""
-        ui.create_ui()
-        ui.answer_label = Mock()
-        ui.status_label = Mock()
-        ui.search_button = Mock()
+        prepared_ui._update_answer("Test answer")
 
-        ui._update_answer("Test answer")
+        prepared_ui.answer_label.config.assert_called_with(text="Test answer")
+        prepared_ui.status_label.config.assert_called_with(text="Ready")
+        prepared_ui.search_button.config.assert_called_with(state="normal")
+        assert prepared_ui.is_searching is False
 
-        ui.answer_label.config.assert_called_with(text="Test answer")
-        ui.status_label.config.assert_called_with(text="Ready")
-        ui.search_button.config.assert_called_with(state="normal")
-        assert ui.is_searching is False
-
-    @pytest.mark.asyncio
-    async def test_perform_search_success(self, ui, mock_tkinter):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_perform_search_success(self, created_ui):
         """Test successful search performance"""
-        ui.create_ui()
-
         with patch(
-            "app.azure_service.AzureOpenAIService.get_coding_answer"
+            "app.azure_service.AzureOpenAIService.get_coding_answer",
+            new_callable=AsyncMock,
         ) as mock_get_answer:
             mock_get_answer.return_value = (
                 "Use binary search for O(log n) time complexity"
             )
 
-            result = await ui._perform_search("What is binary search?")
+            result = await created_ui._perform_search("What is binary search?")
 
             assert "binary search" in result.lower()
-            mock_get_answer.assert_called_once_with("What is binary search?")
+            mock_get_answer.assert_awaited_once_with("What is binary search?")
 
-    @pytest.mark.asyncio
-    async def test_perform_search_error(self, ui, mock_tkinter):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_perform_search_error(self, created_ui):
         """Test search performance with error"""
-        ui.create_ui()
-
         with patch(
-            "app.azure_service.AzureOpenAIService.get_coding_answer"
+            "app.azure_service.AzureOpenAIService.get_coding_answer",
+            new_callable=AsyncMock,
         ) as mock_get_answer:
             mock_get_answer.side_effect = Exception("API Error")
 
-            result = await ui._perform_search("Test question")
+            result = await created_ui._perform_search("Test question")
 
             assert "Error: Unable to get answer" in result
 
@@ -174,29 +203,26 @@ class TestTouchBarUI:
         style.configure.assert_called()
 
         # Verify TouchBar styles are configured
-        style_calls = [call[0] for call in style.configure.call_args_list]
-        assert "TouchBar.TFrame" in style_calls
-        assert "TouchBar.TLabel" in style_calls
-        assert "TouchBar.TButton" in style_calls
+        configured = {c.args[0] for c in style.configure.call_args_list if c.args}
+        assert {"TouchBar.TFrame", "TouchBar.TLabel", "TouchBar.TButton"} <= configured
+
+
+@pytest.fixture(scope="module")
+def simulator():
+    """Share one TouchBarSimulator across the simulator tests"""
+    return TouchBarSimulator()
 
 
 class TestTouchBarSimulator:
     """Test cases for TouchBarSimulator"""
 
-    def test_simulator_initialization(self):
+    def test_simulator_initialization(self, simulator):
         """Test simulator initialization"""
-        if not TKINTER_AVAILABLE:
-            pytest.skip("Tkinter not available")
-        simulator = TouchBarSimulator()
         assert simulator.ui is not None
         assert isinstance(simulator.ui, TouchBarUI)
 
-    def test_simulator_run(self):
+    def test_simulator_run(self, simulator):
         """Test simulator run method"""
-        if not TKINTER_AVAILABLE:
-            pytest.skip("Tkinter not available")
-        simulator = TouchBarSimulator()
-
         with patch.object(simulator.ui, "run") as mock_run:
             with patch("builtins.print") as mock_print:
                 simulator.run()
@@ -208,11 +234,11 @@ class TestTouchBarSimulator:
 class TestTouchBarUIIntegration:
     """Integration tests for Touch Bar UI"""
 
-    @pytest.mark.skipif(True, reason="Requires GUI environment")
+    @pytest.mark.gui
     def test_full_ui_workflow(self):
         """Test full UI workflow (requires GUI)"""
         # This test would require a GUI environment to run
-        # It's skipped by default but can be run manually
+        # It's deselected by default; run it with `pytest -m gui`
         ui = TouchBarUI()
 
         # Test the complete workflow
@@ -229,44 +255,44 @@ class TestTouchBarUIIntegration:
         ui.root.destroy()
 
 
+@pytest.fixture(scope="class")
+def config_ui():
+    """Create the UI once under mocked tkinter for the configuration tests"""
+    with patch("app.touch_bar_ui.tk.Tk") as mock_tk, patch(
+        "app.touch_bar_ui.ttk"
+    ) as mock_ttk:
+        mock_tk.return_value.winfo_screenheight.return_value = 1080
+        ui = TouchBarUI()
+        ui.create_ui()
+        yield ui, mock_tk, mock_ttk
+
+
 class TestTouchBarUIConfiguration:
     """Test Touch Bar UI configuration"""
 
-    def test_ui_dimensions(self):
+    def test_ui_dimensions(self, config_ui):
         """Test UI dimensions match settings"""
-        ui = TouchBarUI()
-
-        with patch("app.touch_bar_ui.tk.Tk") as mock_tk:
-            with patch("app.touch_bar_ui.ttk"):
-                ui.create_ui()
-
-                mock_root = mock_tk.return_value
-                mock_root.geometry.assert_called()
+        _, mock_tk, _ = config_ui
+        mock_root = mock_tk.return_value
+        mock_root.geometry.assert_called()
 
-                # Check that geometry includes correct dimensions
-                geometry_call = mock_root.geometry.call_args[0][0]
-                assert str(settings.TOUCH_BAR_WIDTH) in geometry_call
-                assert str(settings.TOUCH_BAR_HEIGHT) in geometry_call
+        # The size is set first; the later call only positions the window
+        geometry_call = mock_root.geometry.call_args_list[0][0][0]
+        assert geometry_call.startswith(EXPECTED_GEOMETRY_PREFIX)
 
-    def test_ui_colors(self):
+    def test_ui_colors(self, config_ui):
         """Test UI color configuration"""
-        ui = TouchBarUI()
+        _, _, mock_ttk = config_ui
+        style = mock_ttk.Style.return_value
 
-        with patch("app.touch_bar_ui.tk.Tk"):
-            with patch("app.touch_bar_ui.ttk") as mock_ttk:
-                ui.create_ui()
-
-                style = mock_ttk.Style.return_value
-
-                # Check that colors are configured
-                style_calls = style.configure.call_args_list
-                for call in style_calls:
-                    args, kwargs = call
-                    if "TouchBar.TFrame" in args:
-                        assert kwargs.get("background") == settings.BACKGROUND_COLOR
-                    elif "TouchBar.TLabel" in args:
-                        assert kwargs.get("background") == settings.BACKGROUND_COLOR
-                        assert kwargs.get("foreground") == settings.TEXT_COLOR
+        # Check that colors are configured
+        style_map = {
+            c.args[0]: c.kwargs for c in style.configure.call_args_list if c.args
+        }
+        frame, label = style_map["TouchBar.TFrame"], style_map["TouchBar.TLabel"]
+        assert frame["background"] == _BG
+        assert label["background"] == _BG
+        assert label["foreground"] == _FG
 
 
 if __name__ == "__main__":
@@ -0,0 +1,61 @@
+//
+// MTMRTouchBar.swift
+// Native Touch Bar bundle for Touch Bar Coding Assistant
+//
+// Mirrors RobustTouchBarIntegration.setup_touch_bar from app/touchbar_robust.py,
+// but keeps the NSTouchBar delegate and button handling on the native side so a
+// press only crosses into Python once, through the registered press handler.
+//
+
+import AppKit
+
+@objc(MTMRTouchBar)
+public class MTMRTouchBar: NSObject, NSTouchBarDelegate {
+    static let searchIdentifier = NSTouchBarItem.Identifier("robust-search-button")
+    static let customizationIdentifier = NSTouchBar.CustomizationIdentifier("robust-coding-assistant")
+
+    private var touchBar: NSTouchBar?
+    private var pressHandler: (() -> Void)?
+
+    @objc public func setPressHandler(_ handler: @escaping () -> Void) {
+        pressHandler = handler
+    }
+
+    @objc public func activate() {
+        let bar = NSTouchBar()
+        bar.delegate = self
+        bar.defaultItemIdentifiers = [MTMRTouchBar.searchIdentifier]
+        bar.customizationIdentifier = MTMRTouchBar.customizationIdentifier
+        bar.customizationAllowedItemIdentifiers = [MTMRTouchBar.searchIdentifier]
+        touchBar = bar
+
+        NSApp.touchBar = bar
+        NSApp.activate(ignoringOtherApps: true)
+    }
+
+    @objc public func deactivate() {
+        NSApp.touchBar = nil
+        touchBar?.delegate = nil
+        touchBar = nil
+    }
+
+    @objc public func onPress(_ sender: Any?) {
+        pressHandler?()
+    }
+
+    public func touchBar(
+        _ touchBar: NSTouchBar,
+        makeItemForIdentifier identifier: NSTouchBarItem.Identifier
+    ) -> NSTouchBarItem? {
+        guard identifier == MTMRTouchBar.searchIdentifier else {
+            return nil
+        }
+
+        let item = NSCustomTouchBarItem(identifier: identifier)
+        let button = NSButton(title: "🔍 Code", target: self, action: #selector(onPress(_:)))
+        button.bezelColor = NSColor.systemBlue
+        item.view = button
+        item.customizationLabel = "Coding Assistant"
+        return item
+    }
+}
@@ -0,0 +1,34 @@
+#!/bin/sh
+# Build MTMRTouchBar.bundle for app/touchbar_bundle.py
+set -e
+
+cd "$(dirname "$0")"
+
+BUNDLE=build/MTMRTouchBar.bundle
+mkdir -p "$BUNDLE/Contents/MacOS"
+
+swiftc -O \
+    -module-name MTMRTouchBar \
+    -emit-library -Xlinker -bundle \
+    -framework AppKit \
+    -o "$BUNDLE/Contents/MacOS/MTMRTouchBar" \
+    MTMRTouchBar.swift
+
+cat > "$BUNDLE/Contents/Info.plist" <<PLIST
+<?xml version="1.0" encoding="UTF-8"?>
+<!DOCTYPE plist PUBLIC "-//Apple//DTD PLIST 1.0//EN" "http://www.apple.com/DTDs/PropertyList-1.0.dtd">
+<plist version="1.0">
+<dict>
+    <key>CFBundleExecutable</key>
+    <string>MTMRTouchBar</string>
+    <key>CFBundleIdentifier</key>
+    <string>com.touchbar-coding-assistant.MTMRTouchBar</string>
+    <key>CFBundleName</key>
+    <string>MTMRTouchBar</string>
+    <key>CFBundlePackageType</key>
+    <string>BNDL</string>
+</dict>
+</plist>
+PLIST
+
+echo "✅ Built $BUNDLE"